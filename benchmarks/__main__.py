@@ -0,0 +1,42 @@
+"""
+Benchmark Suite
+
+Usage:
+    python -m benchmarks [--filter NAME] [--output results.json]
+                         [--compare baseline.json] [--threshold 0.1]
+"""
+import argparse
+import sys
+from benchmarks.harness import run_benchmarks, compare_results, load_results, save_results
+import benchmarks.bench_world
+import benchmarks.bench_core
+import benchmarks.bench_editor
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Run MMMGame benchmarks")
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this")
+    parser.add_argument("--output", help="write results JSON to this file")
+    parser.add_argument("--compare", help="baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown reported as a regression")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="seconds spent timing each benchmark")
+    args = parser.parse_args()
+    
+    results = run_benchmarks(args.filter, args.min_time)
+    
+    if args.output:
+        save_results(results, args.output)
+    
+    if args.compare:
+        print()
+        regressions = compare_results(load_results(args.compare), results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Core Benchmarks - enemies and projectiles
+"""
+from config import *
+from benchmarks.harness import benchmark, ensure_display
+from benchmarks.bench_world import build_level
+from src.core.enemies import EnemyManager
+from src.core.projectiles import ProjectileSystem
+
+
+def spawn_enemies(manager, count):
+    """Spawn enemies spread over the level"""
+    for i in range(count):
+        manager.spawn_enemy(32 + (i * 37) % 900, 32 + (i * 53) % 600)
+
+
+for count in (10, 100, 1000):
+    
+    @benchmark("enemy_manager.update", enemies=count)
+    def bench_enemy_update(enemies):
+        """One simulation tick of all enemies on a floored level"""
+        ensure_display()
+        level = build_level(64, 48, fill=0.1)
+        manager = EnemyManager()
+        spawn_enemies(manager, enemies)
+        player_pos = (500, 300)
+        
+        def run():
+            manager.update(player_pos, level)
+            # Keep projectile count bounded between calls
+            if len(manager.projectiles) > enemies * 4:
+                manager.projectiles.empty()
+        return run
+
+
+for count in (100, 1000, 10000):
+    
+    @benchmark("projectiles.update", projectiles=count)
+    def bench_projectile_update(projectiles):
+        """Advance a fixed population of projectiles one tick"""
+        ensure_display()
+        system = ProjectileSystem()
+        system.spawn_many([i % 1000 for i in range(projectiles)],
+                          [i // 1000 for i in range(projectiles)],
+                          1, 1, lifetime=1 << 30)
+        
+        def run():
+            system.update()
+        return run
+
+
+@benchmark("projectiles.draw", projectiles=1000)
+def bench_projectile_draw(projectiles):
+    """Draw a fixed population of projectiles"""
+    screen = ensure_display()
+    system = ProjectileSystem()
+    system.spawn_many([i % SCREEN_WIDTH for i in range(projectiles)],
+                      [(i * 7) % SCREEN_HEIGHT for i in range(projectiles)],
+                      0, 0, lifetime=1 << 30)
+    
+    def run():
+        system.draw(screen)
+    return run
+
+
+for count in (100, 1000):
+    
+    @benchmark("combat.update", enemies=count)
+    def bench_combat_update(enemies):
+        """Resolve hits for spread-out enemies and 10 projectiles per enemy"""
+        from src.core.combat import CombatSystem
+        from src.core.player import Player
+        from src.core.projectiles import TEAM_PLAYER
+        
+        ensure_display()
+        level = build_level(64, 48, fill=0.1)
+        manager = EnemyManager()
+        spawn_enemies(manager, enemies)
+        for enemy in manager.slot_enemies.values():
+            enemy.hp = 1 << 30
+        count = enemies * 10
+        manager.projectiles.spawn_many([(i * 13) % 1000 for i in range(count)],
+                                       [(i * 29) % 700 for i in range(count)],
+                                       0, 0, damage=0, lifetime=1 << 30, team=TEAM_PLAYER)
+        player = Player(500, 300)
+        combat = CombatSystem()
+        
+        def run():
+            combat.update(player, manager, None)
+        return run
@@ -0,0 +1,139 @@
+"""
+Editor Benchmarks - room view, level files and texture panel
+"""
+import atexit
+import os
+import tempfile
+import pygame
+from config import *
+from benchmarks.harness import benchmark, ensure_display
+from src.editor.texture_loader import texture_loader
+from src.editor.room_editor import RoomEditor
+from src.editor.level_utils import LevelUtils
+from src.graphics.procedural_sprites import ProceduralSpriteGenerator
+
+
+def register_textures(count):
+    """Register procedural textures named bench_0 .. bench_<count-1>"""
+    for i in range(count):
+        name = f"bench_{i}"
+        if name not in texture_loader.textures:
+            color = (i * 37 % 256, i * 91 % 256, i * 53 % 256)
+            texture_loader.add_texture(name, ProceduralSpriteGenerator.generate_tile_sprite(
+                TILE_SIZE, TILE_SIZE, color
+            ))
+    return [f"bench_{i}" for i in range(count)]
+
+
+def temp_level_path(filename):
+    """Path in a temporary directory that is removed when the run exits"""
+    directory = tempfile.TemporaryDirectory(prefix="mmmgame_bench_")
+    atexit.register(directory.cleanup)
+    return os.path.join(directory.name, filename)
+
+
+def build_room(width=MAX_ROOM_WIDTH, height=MAX_ROOM_HEIGHT, textures=16):
+    """Build a fully painted room"""
+    names = register_textures(textures)
+    room = RoomEditor(width, height)
+    for y in range(height):
+        for x in range(width):
+            room.set_tile(x, y, names[(x * 7 + y) % len(names)])
+    return room
+
+
+def build_level(rooms=MAX_ROOMS):
+    """Build a level with full-size rooms"""
+    level = LevelUtils.create_new_level()
+    level['rooms'] = [build_room().export_data() for _ in range(rooms)]
+    return level
+
+
+@benchmark("room_editor.draw", width=MAX_ROOM_WIDTH, height=MAX_ROOM_HEIGHT)
+def bench_room_draw(width, height):
+    """Draw a full room into an editor-sized view"""
+    ensure_display()
+    room = build_room(width, height)
+    view_rect = pygame.Rect(0, 30, SCREEN_WIDTH - 200, SCREEN_HEIGHT - 30)
+    view_surface = pygame.Surface(view_rect.size)
+    
+    def run():
+        room.draw(view_surface, view_rect)
+    return run
+
+
+@benchmark("level_utils.save_level", rooms=MAX_ROOMS)
+def bench_save_level(rooms):
+    """Save a level with MAX_ROOMS full-size rooms"""
+    ensure_display()
+    level = build_level(rooms)
+    path = temp_level_path("bench_level.json")
+    
+    def run():
+        LevelUtils.save_level(level, path)
+    return run
+
+
+@benchmark("level_utils.load_level", rooms=MAX_ROOMS)
+def bench_load_level(rooms):
+    """Load a level with MAX_ROOMS full-size rooms"""
+    ensure_display()
+    path = temp_level_path("bench_level.json")
+    LevelUtils.save_level(build_level(rooms), path)
+    
+    def run():
+        LevelUtils.load_level(path)
+    return run
+
+
+@benchmark("level_utils.save_level_binary", rooms=MAX_ROOMS)
+def bench_save_level_binary(rooms):
+    """Save a level with MAX_ROOMS full-size rooms in binary format"""
+    ensure_display()
+    level = build_level(rooms)
+    path = temp_level_path("bench_level.lvl")
+    
+    def run():
+        LevelUtils.save_level(level, path)
+    return run
+
+
+@benchmark("level_utils.load_level_binary", rooms=MAX_ROOMS)
+def bench_load_level_binary(rooms):
+    """Load a level with MAX_ROOMS full-size rooms from binary format"""
+    ensure_display()
+    path = temp_level_path("bench_level.lvl")
+    LevelUtils.save_level(build_level(rooms), path)
+    
+    def run():
+        LevelUtils.load_level(path)
+    return run
+
+
+@benchmark("texture_panel.draw", textures=300)
+def bench_texture_panel_draw(textures):
+    """Draw the unchanged texture panel (blits its cached surface)"""
+    from src.editor.texture_panel import TexturePanel
+    
+    screen = ensure_display()
+    register_textures(textures)
+    panel = TexturePanel(SCREEN_WIDTH - 200, 0, 200, SCREEN_HEIGHT)
+    
+    def run():
+        panel.draw(screen)
+    return run
+
+
+@benchmark("texture_panel.render", textures=300)
+def bench_texture_panel_render(textures):
+    """Re-render the texture panel thumbnails on every draw"""
+    from src.editor.texture_panel import TexturePanel
+    
+    screen = ensure_display()
+    register_textures(textures)
+    panel = TexturePanel(SCREEN_WIDTH - 200, 0, 200, SCREEN_HEIGHT)
+    
+    def run():
+        panel.mark_dirty()
+        panel.draw(screen)
+    return run
@@ -0,0 +1,60 @@
+"""
+World Benchmarks - LevelBuilder storage and rendering
+"""
+import random
+from config import *
+from benchmarks.harness import benchmark, ensure_display
+from src.world.tilemap import LevelBuilder
+
+
+def build_level(cols, rows, fill=0.6, seed=1):
+    """Build a LevelBuilder with a random fraction of cells filled"""
+    rng = random.Random(seed)
+    level = LevelBuilder()
+    for row in range(rows):
+        for col in range(cols):
+            if rng.random() < fill:
+                level.add_tile(col * TILE_SIZE, row * TILE_SIZE, "ground")
+    return level
+
+
+for cols, rows in [(64, 48), (256, 96), (MAX_ROOM_WIDTH * MAX_ROOMS, MAX_ROOM_HEIGHT * 2)]:
+    
+    @benchmark("level_builder.draw", cols=cols, rows=rows)
+    def bench_level_draw(cols, rows):
+        """Draw a scrolling camera over the level"""
+        screen = ensure_display()
+        level = build_level(cols, rows)
+        state = {"x": 0}
+        
+        def run():
+            state["x"] = (state["x"] + 3) % max(1, cols * TILE_SIZE - SCREEN_WIDTH)
+            level.draw(screen, state["x"], 0)
+        return run
+    
+    @benchmark("level_builder.get_tile_at", cols=cols, rows=rows)
+    def bench_get_tile_at(cols, rows):
+        """Look up 1000 random positions"""
+        level = build_level(cols, rows)
+        rng = random.Random(2)
+        points = [(rng.randrange(cols) * TILE_SIZE, rng.randrange(rows) * TILE_SIZE)
+                  for _ in range(1000)]
+        
+        def run():
+            for x, y in points:
+                level.get_tile_at(x, y)
+        return run
+
+
+@benchmark("level_builder.add_remove", cols=64, rows=48)
+def bench_add_remove(cols, rows):
+    """Fill and empty a full room"""
+    def run():
+        level = LevelBuilder()
+        for row in range(rows):
+            for col in range(cols):
+                level.add_tile(col * TILE_SIZE, row * TILE_SIZE)
+        for row in range(rows):
+            for col in range(cols):
+                level.remove_tile(col * TILE_SIZE, row * TILE_SIZE)
+    return run
@@ -0,0 +1,156 @@
+"""
+Benchmark Harness - registry, timing and result comparison
+"""
+import os
+
+# Benchmarks always run against the dummy drivers
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+import pygame
+from config import *
+
+
+# Registered benchmarks: list of (name, setup, params)
+BENCHMARKS = []
+
+
+def benchmark(name, **params):
+    """
+    Register a benchmark
+    
+    The decorated function receives params as keyword arguments and
+    returns a zero-argument callable; only that callable is timed.
+    """
+    def decorator(setup):
+        BENCHMARKS.append((name, setup, params))
+        return setup
+    return decorator
+
+
+def ensure_display():
+    """Initialize pygame with a display surface the size of the game screen"""
+    if not pygame.get_init():
+        pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return pygame.display.get_surface()
+
+
+def time_callable(func, min_time=0.2, repeats=5):
+    """
+    Time a callable
+    
+    Each repeat runs the callable enough times to last at least
+    min_time / repeats seconds. Returns per-call timings in microseconds.
+    """
+    clock = time.perf_counter
+    
+    # Calibrate number of calls per repeat
+    number = 1
+    while True:
+        start = clock()
+        for _ in range(number):
+            func()
+        elapsed = clock() - start
+        if elapsed >= min_time / repeats or number >= 1 << 20:
+            break
+        number *= 2
+    
+    samples = []
+    for _ in range(repeats):
+        start = clock()
+        for _ in range(number):
+            func()
+        samples.append((clock() - start) * 1e6 / number)
+    
+    return {
+        "calls": number,
+        "min_us": min(samples),
+        "median_us": statistics.median(samples),
+        "mean_us": statistics.fmean(samples),
+    }
+
+
+def _git_revision():
+    """Get current git commit hash if available"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(name_filter=None, min_time=0.2, repeats=5, verbose=True):
+    """Run registered benchmarks and return results dictionary"""
+    ensure_display()
+    
+    results = []
+    for name, setup, params in BENCHMARKS:
+        label = name
+        if params:
+            label += "[" + ",".join(f"{k}={v}" for k, v in params.items()) + "]"
+        if name_filter and name_filter not in label:
+            continue
+        
+        func = setup(**params)
+        timing = time_callable(func, min_time, repeats)
+        results.append({"name": label, **timing})
+        
+        if verbose:
+            print(f"{label:<48} {timing['median_us']:12.2f} us/call")
+    
+    return {
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare_results(baseline, current, threshold=0.10):
+    """
+    Print per-benchmark change between two result dictionaries
+    
+    Returns:
+        List of benchmark names that got slower by more than threshold
+    """
+    base = {r["name"]: r for r in baseline["results"]}
+    regressions = []
+    
+    print(f"{'benchmark':<48} {'base us':>12} {'new us':>12} {'change':>8}")
+    for result in current["results"]:
+        old = base.get(result["name"])
+        if old is None:
+            print(f"{result['name']:<48} {'-':>12} {result['median_us']:12.2f} {'new':>8}")
+            continue
+        
+        change = result["median_us"] / old["median_us"] - 1 if old["median_us"] else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(result["name"])
+            flag = " !"
+        print(f"{result['name']:<48} {old['median_us']:12.2f} "
+              f"{result['median_us']:12.2f} {change:+8.1%}{flag}")
+    
+    return regressions
+
+
+def load_results(path):
+    """Load results JSON file"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_results(results, path):
+    """Save results JSON file"""
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
@@ -15,11 +15,33 @@ EDITOR_WIDTH = 1680
 EDITOR_HEIGHT = 900
 EDITOR_FULLSCREEN = False
 EDITOR_FONT_SIZE = 12
+EDITOR_LABEL_CACHE_SIZE = 512  # отрисованных подписей панелей в кэше
+EDITOR_IDLE_FPS = 20           # частота опроса редактора без изменений на экране
+ASSET_LOAD_WORKERS = 0         # потоков декодирования изображений (0 = по числу ядер)
+ASSET_TEXTURE_BUDGET_MB = 256  # лимит памяти текстур (0 = без лимита)
+ASSET_ANIMATION_BUDGET_MB = 128
+ASSET_SOUND_BUDGET_MB = 64
+ATLAS_PAGE_SIZE = 1024        # сторона страницы атласа текстур
+ATLAS_MAX_TEXTURE_SIZE = 64   # текстуры больше этого не упаковываются
 
 # ===== РАЗМЕРЫ СПРАЙТОВ И ТАЙЛОВ =====
 SPRITE_SIZE = 16
 TILE_SIZE = 16
-FPS = 60
+CHUNK_SIZE = 16        # тайлов в стороне чанка отрисовки
+FPS = 60               # частота отрисовки (0 = без ограничения)
+TICK_RATE = 60         # шагов симуляции в секунду
+MAX_FRAME_STEPS = 5    # максимум шагов симуляции за кадр
+PROFILER_HISTORY = 240 # кадров в истории профайлера (F3)
+
+# ===== ФИЗИКА И ИГРОК =====
+GRAVITY = 0.5            # пикселей/кадр²
+MAX_FALL_SPEED = 12      # пикселей/кадр (меньше TILE_SIZE)
+PLAYER_HP = 100
+PLAYER_SPEED = 4
+JUMP_STRENGTH = -10
+PLAYER_DAMAGE = 25
+PLAYER_SHOOT_COOLDOWN = 15   # шагов симуляции между выстрелами
+PROJECTILE_SPEED = 5
 
 # ===== РАЗМЕРЫ КОМНАТ =====
 MAX_ROOM_WIDTH = 64      # тайлы
@@ -28,6 +50,13 @@ MIN_ROOM_WIDTH = 16      # тайлы
 MIN_ROOM_HEIGHT = 12     # тайлы
 MAX_ROOMS = 7            # максимум комнат в уровне
 
+# ===== ОТРИСОВКА =====
+DIRTY_RECTS = False      # обновлять только изменённые области экрана
+DIRTY_RECT_LIMIT = 200   # больше прямоугольников - полный flip
+
+# ===== ИНТЕРФЕЙС =====
+TEXT_CACHE_SIZE = 256    # отрисованных строк текста в LRU-кэше
+
 # ===== РАЗМЕРЫ КНОПОК МЕНЮ =====
 BUTTON_WIDTH = 200
 BUTTON_HEIGHT = 50
@@ -41,8 +70,16 @@ GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 DARK_GRAY = (40, 40, 40)
 LIGHT_GRAY = (200, 200, 200)
+GRAY = (128, 128, 128)
 DARK_BLUE = (20, 30, 60)
 
+# Цвета процедурных тайлов по типу
+TILE_COLORS = {
+    "ground": (100, 100, 100),
+    "wall": (80, 80, 80),
+    "grass": (50, 150, 50)
+}
+
 # ===== ПУТИ К АССЕТАМ =====
 BASE_DIR = os.path.dirname(__file__)
 ASSETS_DIR = os.path.join(BASE_DIR, 'assets')
@@ -143,4 +180,4 @@ PASSAGE_TYPES = {
     }
 }
 
-PASSAGE_DIRECTIONS = ["up", "down", "left", "right"]
\ No newline at end of file
+PASSAGE_DIRECTIONS = ["up", "down", "left", "right"]
@@ -0,0 +1,152 @@
+"""
+Combat - hit detection between projectiles, player, enemies and tiles
+"""
+import numpy as np
+from config import *
+from src.core.projectiles import TEAM_ENEMY, TEAM_PLAYER
+from src.world.spatial_hash import SpatialHash
+
+
+def _overlaps(ax, ay, aw, ah, bx, by, bw, bh):
+    """Vectorized AABB overlap test"""
+    return (ax < bx + bw) & (bx < ax + aw) & (ay < by + bh) & (by < ay + ah)
+
+
+class CombatSystem:
+    """Resolves hits every tick using spatial-hash broadphase"""
+    
+    def __init__(self):
+        """Initialize combat system"""
+        self.projectile_hash = SpatialHash(TILE_SIZE)
+        self.enemy_hash = SpatialHash(TILE_SIZE)
+    
+    def update(self, player, enemy_manager, level=None):
+        """Run all collision queries for one tick"""
+        projectiles = enemy_manager.projectiles
+        
+        # Hashes are only rebuilt when there is something to test; the
+        # enemy hash is still valid for shots only if separation moved nobody
+        enemy_slots = np.flatnonzero(enemy_manager.state.alive)
+        hashed = False
+        if len(enemy_slots) > 1:
+            self._rebuild_enemy_hash(enemy_manager, enemy_slots)
+            hashed = not self._separate_enemies(enemy_manager, enemy_slots, level)
+        
+        if not projectiles.count:
+            return
+        
+        if level is not None:
+            self._projectiles_vs_tiles(projectiles, level)
+        
+        slots = projectiles.active_slots()
+        self._projectiles_vs_player(projectiles, slots, player)
+        self._projectiles_vs_enemies(projectiles, slots, enemy_manager, enemy_slots, hashed)
+    
+    def _rebuild_enemy_hash(self, enemy_manager, enemy_slots):
+        """Bucket live enemies by cell"""
+        state = enemy_manager.state
+        self.enemy_hash.rebuild(state.x[enemy_slots], state.y[enemy_slots], TILE_SIZE, TILE_SIZE)
+    
+    def _separate_enemies(self, enemy_manager, enemy_slots, level):
+        """Push overlapping enemies apart horizontally, returns True if any moved"""
+        a, b = self.enemy_hash.query_pairs()
+        if not len(a):
+            return False
+        
+        state = enemy_manager.state
+        slot_a = enemy_slots[a]
+        slot_b = enemy_slots[b]
+        xa, xb = state.x[slot_a], state.x[slot_b]
+        hit = _overlaps(xa, state.y[slot_a], TILE_SIZE, TILE_SIZE,
+                        xb, state.y[slot_b], TILE_SIZE, TILE_SIZE)
+        if not hit.any():
+            return False
+        
+        slot_a, slot_b, xa, xb = slot_a[hit], slot_b[hit], xa[hit], xb[hit]
+        
+        # Each enemy moves half the overlap away from the other
+        overlap = TILE_SIZE - np.abs(xa - xb)
+        direction = np.where(xa <= xb, -1.0, 1.0)
+        push = np.zeros(state.capacity)
+        np.add.at(push, slot_a, direction * overlap / 2)
+        np.add.at(push, slot_b, -direction * overlap / 2)
+        
+        moved = np.flatnonzero(push)
+        if level is not None:
+            x, _, _, _, _, _ = level.collider.move_many(
+                state.x[moved], state.y[moved], TILE_SIZE, TILE_SIZE, push[moved], 0.0
+            )
+            state.x[moved] = x
+        else:
+            state.x[moved] += push[moved]
+        return True
+    
+    def _projectiles_vs_tiles(self, projectiles, level):
+        """Remove projectiles whose center is inside a solid tile"""
+        slots = projectiles.active_slots()
+        if not len(slots):
+            return
+        
+        half = projectiles.SIZE / 2
+        cols = np.floor((projectiles.x[slots] + half) / TILE_SIZE).astype(np.int64)
+        rows = np.floor((projectiles.y[slots] + half) / TILE_SIZE).astype(np.int64)
+        blocked = level.collider.solid_cells(cols, rows)
+        if blocked.any():
+            projectiles.kill(slots[blocked])
+    
+    def _projectiles_vs_player(self, projectiles, slots, player):
+        """Apply enemy projectile hits to the player"""
+        enemy_shots = slots[projectiles.alive[slots] & (projectiles.team[slots] == TEAM_ENEMY)]
+        if not len(enemy_shots):
+            return
+        
+        size = projectiles.SIZE
+        self.projectile_hash.rebuild(projectiles.x[enemy_shots], projectiles.y[enemy_shots], size, size)
+        candidates = enemy_shots[self.projectile_hash.query(
+            (player.x, player.y, player.width, player.height)
+        )]
+        if not len(candidates):
+            return
+        
+        hit = _overlaps(projectiles.x[candidates], projectiles.y[candidates], size, size,
+                        player.x, player.y, player.width, player.height)
+        if hit.any():
+            player.take_damage(float(projectiles.damage[candidates[hit]].sum()))
+            projectiles.kill(candidates[hit])
+    
+    def _projectiles_vs_enemies(self, projectiles, slots, enemy_manager, enemy_slots, hashed):
+        """Apply player projectile hits to enemies (one enemy per projectile)"""
+        player_shots = slots[projectiles.alive[slots] & (projectiles.team[slots] == TEAM_PLAYER)]
+        if not len(player_shots) or not len(enemy_slots):
+            return
+        
+        if not hashed:
+            self._rebuild_enemy_hash(enemy_manager, enemy_slots)
+        
+        size = projectiles.SIZE
+        shot_index, enemy_index = self.enemy_hash.query_many(
+            projectiles.x[player_shots], projectiles.y[player_shots], size, size
+        )
+        if not len(shot_index):
+            return
+        
+        state = enemy_manager.state
+        shots = player_shots[shot_index]
+        targets = enemy_slots[enemy_index]
+        hit = _overlaps(projectiles.x[shots], projectiles.y[shots], size, size,
+                        state.x[targets], state.y[targets], TILE_SIZE, TILE_SIZE)
+        shots, targets = shots[hit], targets[hit]
+        if not len(shots):
+            return
+        
+        # query_many output is sorted by shot, so the first pair per shot wins
+        shots, first = np.unique(shots, return_index=True)
+        targets = targets[first]
+        projectiles.kill(shots)
+        
+        damage = np.zeros(state.capacity)
+        np.add.at(damage, targets, projectiles.damage[shots])
+        for slot in np.flatnonzero(damage).tolist():
+            enemy = enemy_manager.slot_enemies.get(slot)
+            if enemy is not None:
+                enemy.take_damage(float(damage[slot]))
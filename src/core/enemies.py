@@ -1,21 +1,106 @@
 """
 Enemy Classes and Manager
 """
+import numpy as np
 import pygame
 import random
 from config import *
-from src.core.projectiles import Projectile
+from src.core.projectiles import ProjectileSystem
+
+
+class EnemyState:
+    """Struct-of-arrays storage for enemy simulation state"""
+    
+    # Per-slot arrays
+    FIELDS = (
+        ('x', np.float64),
+        ('y', np.float64),
+        ('prev_x', np.float64),
+        ('prev_y', np.float64),
+        ('vx', np.float64),
+        ('vy', np.float64),
+        ('hp', np.float64),
+        ('speed', np.float64),
+        ('damage', np.float64),
+        ('shoot_cooldown', np.int32),
+        ('alive', np.bool_),
+    )
+    
+    def __init__(self, capacity=64):
+        """Initialize enemy state storage"""
+        self.capacity = 0
+        self.count = 0
+        self._allocate(capacity)
+    
+    def _allocate(self, capacity):
+        """Resize slot arrays, keeping existing enemies"""
+        for name, dtype in self.FIELDS:
+            array = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                array[:self.capacity] = getattr(self, name)
+            setattr(self, name, array)
+        self.capacity = capacity
+    
+    def claim(self):
+        """Reserve a free slot, growing storage if needed"""
+        if self.count >= self.capacity:
+            self._allocate(max(1, self.capacity * 2))
+        slot = int(np.argmin(self.alive))
+        self.alive[slot] = True
+        self.count += 1
+        return slot
+    
+    def release(self, slot):
+        """Free a slot for reuse"""
+        if self.alive[slot]:
+            self.alive[slot] = False
+            self.count -= 1
+
+
+def _state_field(name):
+    """Property reading/writing one EnemyState array at the enemy's slot"""
+    def getter(self):
+        return getattr(self.state, name)[self.slot].item()
+    
+    def setter(self, value):
+        getattr(self.state, name)[self.slot] = value
+    
+    return property(getter, setter)
 
 
 class Enemy(pygame.sprite.Sprite):
-    """Base enemy class"""
+    """
+    Base enemy class
+    
+    Simulation state lives in an EnemyState slot; the attributes below are
+    views into it. Enemies added to an EnemyManager share its state arrays
+    and are updated in bulk by EnemyManager.update_enemies().
+    """
+    
+    x = _state_field('x')
+    y = _state_field('y')
+    prev_x = _state_field('prev_x')
+    prev_y = _state_field('prev_y')
+    vx = _state_field('vx')
+    vy = _state_field('vy')
+    hp = _state_field('hp')
+    speed = _state_field('speed')
+    damage = _state_field('damage')
+    shoot_cooldown = _state_field('shoot_cooldown')
     
     def __init__(self, x, y, enemy_type="basic"):
         """Initialize enemy"""
         super().__init__()
         
+        # Private storage until added to a manager
+        self.state = EnemyState(1)
+        self.slot = self.state.claim()
+        self.manager = None
+        
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.vx = 0
         self.vy = 0
         self.enemy_type = enemy_type
@@ -30,16 +115,30 @@ class Enemy(pygame.sprite.Sprite):
         self.height = TILE_SIZE
         self.image = pygame.Surface((self.width, self.height))
         self.image.fill(RED)
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
         
         # AI
         self.direction = random.choice([-1, 1])
         self.shoot_cooldown = 0
     
-    def update(self, player_pos, projectiles):
-        """Update enemy"""
+    @property
+    def rect(self):
+        """Enemy bounds in world coordinates"""
+        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+    
+    def move_to_state(self, state):
+        """Move simulation state into another EnemyState"""
+        slot = state.claim()
+        for name, _ in EnemyState.FIELDS:
+            getattr(state, name)[slot] = getattr(self.state, name)[self.slot]
+        self.state.release(self.slot)
+        self.state = state
+        self.slot = slot
+    
+    def update(self, player_pos, projectiles, level=None):
+        """Update enemy (single-enemy path, see EnemyManager.update_enemies)"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
         # Simple AI - move towards player
         dx = player_pos[0] - self.x
         
@@ -49,13 +148,16 @@ class Enemy(pygame.sprite.Sprite):
             self.vx = 0
         
         # Apply gravity
-        self.vy += GRAVITY
+        self.vy = min(self.vy + GRAVITY, MAX_FALL_SPEED)
         
-        # Update position
-        self.x += self.vx
-        self.y += self.vy
-        self.rect.x = int(self.x)
-        self.rect.y = int(self.y)
+        # Update position with tile collision
+        if level is not None:
+            self.x, self.y, self.vx, self.vy, _, _ = level.collider.move(
+                self.x, self.y, self.width, self.height, self.vx, self.vy
+            )
+        else:
+            self.x += self.vx
+            self.y += self.vy
         
         # Shooting
         self.shoot_cooldown -= 1
@@ -73,8 +175,7 @@ class Enemy(pygame.sprite.Sprite):
         vx = (dx / distance) * 5
         vy = (dy / distance) * 5
         
-        projectile = Projectile(self.x, self.y, vx, vy, self.damage, RED)
-        projectiles.add(projectile)
+        projectiles.spawn(self.x, self.y, vx, vy, self.damage, RED)
     
     def take_damage(self, damage):
         """Take damage"""
@@ -82,45 +183,151 @@ class Enemy(pygame.sprite.Sprite):
         if self.hp <= 0:
             self.kill()
     
-    def draw(self, surface, camera_x=0, camera_y=0):
+    def kill(self):
+        """Remove enemy from all groups and its manager"""
+        if self.manager is not None:
+            self.manager.remove_enemy(self)
+        super().kill()
+    
+    def get_render_pos(self, alpha=1.0):
+        """Get position interpolated between the last two simulation ticks"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+    
+    def draw(self, surface, camera_x=0, camera_y=0, alpha=1.0):
         """Draw enemy"""
-        surface.blit(self.image, (self.rect.x - camera_x, self.rect.y - camera_y))
+        x, y = self.get_render_pos(alpha)
+        surface.blit(self.image, (int(x - camera_x), int(y - camera_y)))
 
 
 class EnemyManager:
     """Manages all enemies in the game"""
     
+    # Below this many enemies the fixed cost of the vectorized tile
+    # collision outweighs the per-enemy loop, so enemies update one by one
+    VECTORIZE_MIN = 10
+    
     def __init__(self):
         """Initialize enemy manager"""
         self.enemies = pygame.sprite.Group()
-        self.projectiles = pygame.sprite.Group()
+        self.projectiles = ProjectileSystem()
+        self.state = EnemyState()
+        self.slot_enemies = {}  # Dictionary of slot: Enemy
     
     def add_enemy(self, enemy):
         """Add enemy to manager"""
+        if enemy.manager is self:
+            return
+        if enemy.manager is not None:
+            enemy.manager.remove_enemy(enemy)
+        
+        enemy.move_to_state(self.state)
+        enemy.manager = self
+        self.slot_enemies[enemy.slot] = enemy
         self.enemies.add(enemy)
     
+    def remove_enemy(self, enemy):
+        """Remove enemy from manager, keeping its state readable"""
+        if enemy.manager is not self:
+            return
+        
+        del self.slot_enemies[enemy.slot]
+        enemy.move_to_state(EnemyState(1))
+        enemy.manager = None
+        self.enemies.remove(enemy)
+    
     def spawn_enemy(self, x, y, enemy_type="basic"):
         """Spawn new enemy"""
         enemy = Enemy(x, y, enemy_type)
         self.add_enemy(enemy)
         return enemy
     
-    def update(self, player_pos):
-        """Update all enemies"""
-        for enemy in self.enemies:
-            enemy.update(player_pos, self.projectiles)
+    def update(self, player_pos, level=None):
+        """Update all enemies and projectiles"""
+        self.update_enemies(player_pos, level)
+        self.update_projectiles()
+    
+    def update_enemies(self, player_pos, level=None):
+        """Update all enemies in one vectorized pass"""
+        state = self.state
+        if not state.count:
+            return
+        
+        if level is not None and state.count < self.VECTORIZE_MIN:
+            for enemy in list(self.slot_enemies.values()):
+                enemy.update(player_pos, self.projectiles, level)
+            return
+        
+        slots = np.flatnonzero(state.alive)
+        x = state.x[slots]
+        y = state.y[slots]
+        state.prev_x[slots] = x
+        state.prev_y[slots] = y
+        
+        # Simple AI - move towards player
+        dx = player_pos[0] - x
+        vx = np.where(np.abs(dx) > 5, np.sign(dx) * state.speed[slots], 0.0)
+        
+        # Apply gravity
+        vy = np.minimum(state.vy[slots] + GRAVITY, MAX_FALL_SPEED)
+        
+        # Update position with tile collision
+        if level is not None:
+            x, y, vx, vy, _, _ = level.collider.move_many(x, y, TILE_SIZE, TILE_SIZE, vx, vy)
+        else:
+            x = x + vx
+            y = y + vy
+        
+        state.x[slots] = x
+        state.y[slots] = y
+        state.vx[slots] = vx
+        state.vy[slots] = vy
+        
+        # Shooting
+        cooldown = state.shoot_cooldown[slots] - 1
+        fire = (cooldown <= 0) & (np.abs(dx) < 300)
+        if fire.any():
+            self._shoot_many(slots[fire], x[fire], y[fire], player_pos)
+            cooldown[fire] = 60  # 1 second at 60 FPS
+        state.shoot_cooldown[slots] = cooldown
+    
+    def _shoot_many(self, slots, x, y, player_pos):
+        """Spawn one projectile towards the player per firing enemy"""
+        dx = player_pos[0] - x
+        dy = player_pos[1] - y
+        distance = np.maximum(1, np.hypot(dx, dy))
         
+        # Normalize and scale
+        vx = dx / distance * 5
+        vy = dy / distance * 5
+        
+        self.projectiles.spawn_many(x, y, vx, vy, self.state.damage[slots], RED)
+    
+    def update_projectiles(self):
+        """Update all projectiles"""
         self.projectiles.update()
     
-    def draw(self, surface, camera_x=0, camera_y=0):
-        """Draw all enemies and projectiles"""
-        for enemy in self.enemies:
-            enemy.draw(surface, camera_x, camera_y)
+    def draw(self, surface, camera_x=0, camera_y=0, alpha=1.0):
+        """Draw all enemies and projectiles, returns rects drawn"""
+        rects = []
+        state = self.state
+        if state.count:
+            slots = np.flatnonzero(state.alive)
+            prev_x = state.prev_x[slots]
+            prev_y = state.prev_y[slots]
+            xs = (prev_x + (state.x[slots] - prev_x) * alpha - camera_x).astype(np.int32)
+            ys = (prev_y + (state.y[slots] - prev_y) * alpha - camera_y).astype(np.int32)
+            rects = surface.blits([
+                (self.slot_enemies[slot].image, (x, y))
+                for slot, x, y in zip(slots.tolist(), xs.tolist(), ys.tolist())
+            ])
         
-        for projectile in self.projectiles:
-            projectile.draw(surface, camera_x, camera_y)
+        rects += self.projectiles.draw(surface, camera_x, camera_y, alpha)
+        return rects
     
     def clear(self):
         """Clear all enemies and projectiles"""
+        for enemy in list(self.slot_enemies.values()):
+            self.remove_enemy(enemy)
         self.enemies.empty()
         self.projectiles.empty()
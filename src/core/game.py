@@ -5,30 +5,65 @@ import pygame
 from config import *
 from src.core.player import Player
 from src.core.enemies import EnemyManager
+from src.core.combat import CombatSystem
+from src.core.profiler import FrameProfiler, ProfilerOverlay
 from src.world.tilemap import LevelBuilder
+from src.graphics.dirty_renderer import DirtyRectRenderer
+from src.ui.hud import Hud, HudText
 
 
 class Game:
     """Main game class"""
     
-    def __init__(self):
-        """Initialize game"""
+    def __init__(self, headless=False, dirty_rects=DIRTY_RECTS, level_file=None):
+        """
+        Initialize game
+        
+        Args:
+            headless: Run without presenting frames (see src.core.headless)
+            dirty_rects: Present only changed screen areas while the camera is still
+            level_file: Editor level to play (None = built-in test level)
+        """
+        self.headless = headless
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("MMMGame")
         self.clock = pygame.time.Clock()
         self.running = True
         
+        # Input (None = read the real keyboard)
+        self.scripted_input = None
+        self.tick = 0
+        
         # Game objects
         self.player = Player(100, 100)
         self.enemy_manager = EnemyManager()
         self.level_builder = LevelBuilder()
+        self.combat = CombatSystem()
         
         # Camera
         self.camera_x = 0
         self.camera_y = 0
+        self.prev_camera_x = 0
+        self.prev_camera_y = 0
+        
+        # Rendering
+        self.dirty_renderer = DirtyRectRenderer(self.screen) if dirty_rects else None
+        
+        # HUD
+        self.hud = Hud()
+        self.hud.add(HudText((10, 10), lambda: self.player.hp, "HP: {:g}"))
+        
+        # Profiling (F3 toggles the overlay)
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+        
+        # Fixed timestep
+        self.tick_ms = 1000.0 / TICK_RATE
+        self.accumulator = 0.0
         
         # Load level
-        self._load_test_level()
+        if not (level_file and self.level_builder.load_from_file(level_file)):
+            self._load_test_level()
     
     def _load_test_level(self):
         """Load test level"""
@@ -49,51 +84,118 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_F3:
+                    self.profiler_overlay.toggle()
+        self.profiler.lap("events")
+    
+    def get_keys(self):
+        """Get pressed keys for the current tick"""
+        if self.scripted_input is not None:
+            return self.scripted_input.get_pressed(self.tick)
+        return pygame.key.get_pressed()
     
     def update(self):
         """Update game state"""
-        keys = pygame.key.get_pressed()
+        self.update_player()
+        self.update_camera()
+        self.profiler.lap("player")
         
-        # Update player
-        tiles = self.level_builder.get_tiles()
-        self.player.update(keys, tiles)
+        self.update_enemies()
+        self.profiler.lap("enemies")
         
-        # Update enemies
-        player_pos = (self.player.x, self.player.y)
-        self.enemy_manager.update(player_pos)
+        self.update_projectiles()
+        self.profiler.lap("projectiles")
         
-        # Update camera
+        self.tick += 1
+    
+    def update_player(self):
+        """Update player"""
+        self.player.update(self.get_keys(), self.level_builder, self.enemy_manager.projectiles)
+    
+    def update_enemies(self):
+        """Update enemies"""
+        player_pos = (self.player.x, self.player.y)
+        self.enemy_manager.update_enemies(player_pos, self.level_builder)
+    
+    def update_projectiles(self):
+        """Update projectiles and resolve hits"""
+        self.enemy_manager.update_projectiles()
+        self.combat.update(self.player, self.enemy_manager, self.level_builder)
+    
+    def update_camera(self):
+        """Update camera to follow player"""
+        self.prev_camera_x = self.camera_x
+        self.prev_camera_y = self.camera_y
         self.camera_x = max(0, self.player.x - SCREEN_WIDTH // 2)
         self.camera_y = max(0, self.player.y - SCREEN_HEIGHT // 2)
     
-    def draw(self):
-        """Draw game"""
-        self.screen.fill(BLACK)
+    def draw(self, alpha=1.0):
+        """
+        Draw game
+        
+        Args:
+            alpha: Fraction of a simulation tick elapsed since the last
+                update, used to interpolate positions between ticks
+        """
+        camera_x = int(self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha)
+        camera_y = int(self.prev_camera_y + (self.camera_y - self.prev_camera_y) * alpha)
         
         # Draw level
-        self.level_builder.draw(self.screen, self.camera_x, self.camera_y)
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.begin_frame(self.level_builder, camera_x, camera_y)
+        else:
+            self.screen.fill(BLACK)
+            self.level_builder.draw(self.screen, camera_x, camera_y)
+        self.profiler.lap("level")
         
         # Draw enemies
-        self.enemy_manager.draw(self.screen, self.camera_x, self.camera_y)
+        rects = self.enemy_manager.draw(self.screen, camera_x, camera_y, alpha)
         
         # Draw player
-        self.player.draw(self.screen, self.camera_x, self.camera_y)
+        rects.append(self.player.draw(self.screen, camera_x, camera_y, alpha))
+        self.profiler.lap("entities")
         
         # Draw UI
-        self._draw_ui()
+        rects += self._draw_ui()
+        rects += self.profiler_overlay.draw(self.screen)
+        self.profiler.lap("ui")
         
-        pygame.display.flip()
+        if not self.headless:
+            if self.dirty_renderer is not None:
+                self.dirty_renderer.present(rects)
+            else:
+                pygame.display.flip()
+        self.profiler.lap("present")
     
     def _draw_ui(self):
-        """Draw UI elements"""
-        font = pygame.font.Font(None, 36)
-        hp_text = font.render(f"HP: {self.player.hp}", True, WHITE)
-        self.screen.blit(hp_text, (10, 10))
+        """Draw UI elements, returns rects drawn"""
+        return self.hud.draw(self.screen)
+    
+    def step(self, frame_ms):
+        """
+        Advance simulation by a frame's worth of fixed ticks
+        
+        Returns:
+            Number of update() ticks run this frame
+        """
+        # Cap catch-up so a long stall doesn't spiral into ever longer frames
+        max_ms = self.tick_ms * MAX_FRAME_STEPS
+        self.accumulator += min(frame_ms, max_ms)
+        
+        steps = 0
+        while self.accumulator >= self.tick_ms:
+            self.update()
+            self.accumulator -= self.tick_ms
+            steps += 1
+        return steps
     
     def run(self):
         """Main game loop"""
+        self.clock.tick()
         while self.running:
+            frame_ms = self.clock.tick(FPS)
+            self.profiler.begin_frame()
             self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            self.step(frame_ms)
+            self.draw(self.accumulator / self.tick_ms)
+            self.profiler.end_frame()
@@ -0,0 +1,137 @@
+"""
+Headless Simulation - runs the game without a display for benchmarking
+
+Usage:
+    python -m src.core.headless --ticks 5000 --enemies 100 [--draw] [--json]
+"""
+import os
+
+# Must be set before pygame initializes its video subsystem
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import time
+import pygame
+from config import *
+
+
+class ScriptedKeys:
+    """Pressed-keys object compatible with pygame.key.get_pressed() indexing"""
+    
+    def __init__(self, pressed):
+        """Initialize with a set of pressed key codes"""
+        self.pressed = pressed
+    
+    def __getitem__(self, key):
+        """Check if key is pressed"""
+        return key in self.pressed
+
+
+class ScriptedInput:
+    """Deterministic input script for headless runs"""
+    
+    def __init__(self, script=None):
+        """
+        Initialize scripted input
+        
+        Args:
+            script: Callable tick -> iterable of pressed key codes.
+                Defaults to walking back and forth and jumping periodically.
+        """
+        self.script = script or self._default_script
+    
+    @staticmethod
+    def _default_script(tick):
+        """Walk right, then left, jumping every 90 ticks"""
+        keys = {pygame.K_RIGHT} if (tick // 120) % 2 == 0 else {pygame.K_LEFT}
+        if tick % 90 == 0:
+            keys.add(pygame.K_SPACE)
+        return keys
+    
+    def get_pressed(self, tick):
+        """Get pressed keys for a tick"""
+        return ScriptedKeys(set(self.script(tick)))
+
+
+def run_headless(ticks=1000, enemies=0, draw=False, script=None, level_file=None):
+    """
+    Run a fixed number of simulation ticks as fast as possible
+    
+    Args:
+        ticks: Number of update() ticks to run
+        enemies: Extra enemies to spawn on top of the test level
+        draw: Also render every tick (to an off-screen display)
+        script: Optional input script, see ScriptedInput
+        level_file: Editor level to load instead of the test level
+    
+    Returns:
+        Dictionary with ticks/sec and per-phase timings in milliseconds
+    """
+    from src.core.game import Game
+    
+    pygame.init()
+    game = Game(headless=True, level_file=level_file)
+    game.scripted_input = ScriptedInput(script)
+    
+    for i in range(enemies):
+        game.enemy_manager.spawn_enemy(100 + (i * 37) % 800, 100 + (i * 53) % 400)
+    
+    profiler = game.profiler
+    profiler.enable()
+    
+    start = time.perf_counter()
+    for _ in range(ticks):
+        profiler.begin_frame()
+        pygame.event.pump()
+        profiler.lap("events")
+        game.update()
+        if draw:
+            game.draw()
+        profiler.end_frame()
+    total = time.perf_counter() - start
+    
+    phases = dict(zip(profiler.phases, profiler.totals))
+    stats = profiler.stats()
+    
+    return {
+        "ticks": ticks,
+        "enemies": len(game.enemy_manager.enemies),
+        "projectiles": len(game.enemy_manager.projectiles),
+        "draw": draw,
+        "total_s": total,
+        "ticks_per_sec": ticks / total if total > 0 else 0.0,
+        "phase_ms_per_tick": {name: value * 1000 / ticks for name, value in phases.items()},
+        "frame_ms_p95": stats["frame"]["p95"],
+        "frame_ms_p99": stats["frame"]["p99"],
+    }
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Run MMMGame simulation headless")
+    parser.add_argument("--ticks", type=int, default=1000, help="simulation ticks to run")
+    parser.add_argument("--enemies", type=int, default=0, help="extra enemies to spawn")
+    parser.add_argument("--draw", action="store_true", help="render every tick")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--level", help="editor level file to load")
+    args = parser.parse_args()
+    
+    result = run_headless(args.ticks, args.enemies, args.draw, level_file=args.level)
+    pygame.quit()
+    
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    
+    print(f"{result['ticks']} ticks in {result['total_s']:.3f}s "
+          f"({result['ticks_per_sec']:.1f} ticks/sec, "
+          f"{result['enemies']} enemies, {result['projectiles']} projectiles)")
+    for name, value in result["phase_ms_per_tick"].items():
+        print(f"  {name:<12} {value:8.4f} ms/tick")
+    print(f"  frame p95 {result['frame_ms_p95']:.3f} ms, p99 {result['frame_ms_p99']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ Player Class
 """
 import pygame
 from config import *
+from src.core.projectiles import TEAM_PLAYER
 from src.graphics.animation import Animation, AnimationManager
 from src.graphics.procedural_sprites import ProceduralSpriteGenerator
 
@@ -17,6 +18,8 @@ class Player(pygame.sprite.Sprite):
         # Position and movement
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.vx = 0
         self.vy = 0
         
@@ -40,6 +43,7 @@ class Player(pygame.sprite.Sprite):
         # State
         self.facing_right = True
         self.on_ground = False
+        self.shoot_cooldown = 0
     
     def _setup_animations(self):
         """Setup player animations"""
@@ -56,8 +60,18 @@ class Player(pygame.sprite.Sprite):
         ]
         self.animation_manager.add_animation("walk", Animation(walk_frames, 200))
     
-    def update(self, keys, tiles):
-        """Update player state"""
+    def update(self, keys, level=None, projectiles=None):
+        """
+        Update player state
+        
+        Args:
+            keys: Pressed keys state (pygame.key.get_pressed())
+            level: LevelBuilder to collide with, or None for free movement
+            projectiles: ProjectileSystem to fire into, or None
+        """
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
         # Handle input
         self.vx = 0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
@@ -75,23 +89,51 @@ class Player(pygame.sprite.Sprite):
             self.vy = JUMP_STRENGTH
         
         # Apply gravity
-        self.vy += GRAVITY
-        
-        # Update position
-        self.x += self.vx
-        self.y += self.vy
+        self.vy = min(self.vy + GRAVITY, MAX_FALL_SPEED)
         
-        # Collision detection (simplified)
-        self.on_ground = False
+        # Update position with tile collision
+        if level is not None:
+            self.x, self.y, self.vx, self.vy, self.on_ground, _ = level.collider.move(
+                self.x, self.y, self.width, self.height, self.vx, self.vy
+            )
+        else:
+            self.x += self.vx
+            self.y += self.vy
+            self.on_ground = False
         self.rect.x = int(self.x)
         self.rect.y = int(self.y)
         
+        # Shooting
+        self.shoot_cooldown -= 1
+        if (keys[pygame.K_f] or keys[pygame.K_LCTRL]) and projectiles is not None:
+            if self.shoot_cooldown <= 0:
+                self._shoot(projectiles)
+                self.shoot_cooldown = PLAYER_SHOOT_COOLDOWN
+        
         # Update animation
         self.animation_manager.update()
         frame = self.animation_manager.get_current_frame()
         if frame:
             self.image = frame
     
-    def draw(self, surface, camera_x=0, camera_y=0):
-        """Draw player"""
-        surface.blit(self.image, (self.rect.x - camera_x, self.rect.y - camera_y))
+    def _shoot(self, projectiles):
+        """Shoot projectile in facing direction"""
+        direction = 1 if self.facing_right else -1
+        x = self.x + self.width // 2 + direction * self.width // 2
+        y = self.y + self.height // 3
+        projectiles.spawn(x, y, direction * PROJECTILE_SPEED, 0, PLAYER_DAMAGE, WHITE,
+                          team=TEAM_PLAYER)
+    
+    def take_damage(self, damage):
+        """Take damage"""
+        self.hp = max(0, self.hp - damage)
+    
+    def get_render_pos(self, alpha=1.0):
+        """Get position interpolated between the last two simulation ticks"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+    
+    def draw(self, surface, camera_x=0, camera_y=0, alpha=1.0):
+        """Draw player, returns the screen rect drawn"""
+        x, y = self.get_render_pos(alpha)
+        return surface.blit(self.image, (int(x - camera_x), int(y - camera_y)))
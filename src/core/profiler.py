@@ -0,0 +1,227 @@
+"""
+Frame Profiler - per-phase frame timings and debug overlay
+"""
+import time
+from array import array
+import pygame
+from config import *
+from src.ui.hud import font_cache, text_cache
+
+
+# Phases timed every frame, in the order they run
+FRAME_PHASES = ("events", "player", "enemies", "projectiles", "level", "entities", "ui", "present")
+
+
+class FrameProfiler:
+    """Records per-phase frame timings into a fixed-size ring buffer"""
+    
+    def __init__(self, phases=FRAME_PHASES, capacity=PROFILER_HISTORY):
+        """
+        Initialize frame profiler
+        
+        Args:
+            phases: Names of the timed phases
+            capacity: Number of frames kept in the ring buffer
+        """
+        self.phases = tuple(phases)
+        self.phase_index = {name: i for i, name in enumerate(self.phases)}
+        self.capacity = capacity
+        
+        # Ring buffers (seconds): one row of len(phases) per frame
+        self.samples = array('d', bytes(8 * capacity * len(self.phases)))
+        self.frame_times = array('d', bytes(8 * capacity))
+        self.frame_count = 0
+        
+        # Running totals since reset (seconds)
+        self.totals = [0.0] * len(self.phases)
+        
+        self.current = [0.0] * len(self.phases)
+        self.last = time.perf_counter()
+        self.enabled = True
+        self.disable()
+    
+    def enable(self):
+        """Start recording timings"""
+        if not self.enabled:
+            self.enabled = True
+            # Drop the no-op instance overrides so the class methods apply
+            del self.begin_frame, self.lap, self.end_frame
+    
+    def disable(self):
+        """Stop recording; begin_frame/lap/end_frame become no-ops"""
+        if self.enabled:
+            self.enabled = False
+            self.begin_frame = self.lap = self.end_frame = self._noop
+    
+    def toggle(self):
+        """Toggle recording"""
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+    
+    @staticmethod
+    def _noop(*args):
+        """Placeholder used while disabled"""
+    
+    def begin_frame(self):
+        """Start timing a new frame"""
+        for i in range(len(self.current)):
+            self.current[i] = 0.0
+        self.last = time.perf_counter()
+    
+    def lap(self, phase):
+        """Attribute time since the previous lap to a phase"""
+        now = time.perf_counter()
+        self.current[self.phase_index[phase]] += now - self.last
+        self.last = now
+    
+    def end_frame(self):
+        """Store the finished frame in the ring buffer"""
+        slot = self.frame_count % self.capacity
+        base = slot * len(self.phases)
+        frame_total = 0.0
+        for i, value in enumerate(self.current):
+            self.samples[base + i] = value
+            self.totals[i] += value
+            frame_total += value
+        self.frame_times[slot] = frame_total
+        self.frame_count += 1
+    
+    def reset(self):
+        """Clear recorded history"""
+        self.frame_count = 0
+        self.totals = [0.0] * len(self.phases)
+    
+    def history_size(self):
+        """Number of frames currently held in the ring buffer"""
+        return min(self.frame_count, self.capacity)
+    
+    def phase_samples(self, phase):
+        """Get buffered timings (seconds) of one phase"""
+        index = self.phase_index[phase]
+        step = len(self.phases)
+        return [self.samples[slot * step + index] for slot in range(self.history_size())]
+    
+    def recent_frame_times(self):
+        """Get buffered frame times (seconds), oldest first"""
+        size = self.history_size()
+        if self.frame_count <= self.capacity:
+            return list(self.frame_times[:size])
+        start = self.frame_count % self.capacity
+        return list(self.frame_times[start:]) + list(self.frame_times[:start])
+    
+    @staticmethod
+    def _percentile(values, percent):
+        """Nearest-rank percentile of a list"""
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        rank = max(0, min(len(ordered) - 1, int(round(percent / 100 * len(ordered))) - 1))
+        return ordered[rank]
+    
+    def stats(self):
+        """
+        Get rolling statistics over the ring buffer
+        
+        Returns:
+            Dictionary phase -> {'avg', 'p95', 'p99'} in milliseconds,
+            including a 'frame' entry for whole-frame times
+        """
+        result = {}
+        series = [(phase, self.phase_samples(phase)) for phase in self.phases]
+        series.append(("frame", self.recent_frame_times()))
+        for name, values in series:
+            avg = sum(values) / len(values) if values else 0.0
+            result[name] = {
+                'avg': avg * 1000,
+                'p95': self._percentile(values, 95) * 1000,
+                'p99': self._percentile(values, 99) * 1000,
+            }
+        return result
+
+
+class ProfilerOverlay:
+    """Debug overlay showing profiler statistics and a frame-time graph"""
+    
+    def __init__(self, profiler, refresh_frames=15):
+        """
+        Initialize profiler overlay
+        
+        Args:
+            profiler: FrameProfiler to display
+            refresh_frames: Recompute statistics every N drawn frames
+        """
+        self.profiler = profiler
+        self.refresh_frames = refresh_frames
+        self.visible = False
+        self.text_surface = None
+        self.frames_since_refresh = refresh_frames
+        self.width = 260
+        self.graph_height = 60
+    
+    def toggle(self):
+        """Show or hide the overlay (recording follows visibility)"""
+        self.visible = not self.visible
+        if self.visible:
+            self.profiler.reset()
+            self.profiler.enable()
+            self.frames_since_refresh = self.refresh_frames
+        else:
+            self.profiler.disable()
+    
+    def _render_text(self):
+        """Render statistics table into a cached surface"""
+        stats = self.profiler.stats()
+        lines = [f"{'phase':<12}{'avg':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name in self.profiler.phases + ("frame",):
+            values = stats[name]
+            lines.append(f"{name:<12}{values['avg']:7.2f}{values['p95']:7.2f}{values['p99']:7.2f}")
+        
+        line_height = font_cache.get(18).get_linesize()
+        surface = pygame.Surface((self.width, line_height * len(lines) + 8), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 180))
+        for i, line in enumerate(lines):
+            # Default font is proportional, so draw columns separately
+            columns = [line[:12], line[12:19], line[19:26], line[26:]]
+            x = 6
+            for j, text in enumerate(columns):
+                surface.blit(text_cache.render(text.strip(), 18), (x, 4 + i * line_height))
+                x += 90 if j == 0 else 50
+        self.text_surface = surface
+    
+    def _draw_graph(self, surface, x, y):
+        """Draw frame-time graph; the dashed line marks one frame at FPS"""
+        times = self.profiler.recent_frame_times()
+        graph = pygame.Rect(x, y, self.width, self.graph_height)
+        pygame.draw.rect(surface, (0, 0, 0), graph)
+        
+        budget = 1.0 / (FPS or TICK_RATE)
+        scale = self.graph_height / (budget * 2)
+        budget_y = graph.bottom - int(budget * scale)
+        for dash_x in range(graph.left, graph.right, 8):
+            pygame.draw.line(surface, (90, 90, 90), (dash_x, budget_y), (dash_x + 4, budget_y))
+        
+        if len(times) > 1:
+            step = self.width / (self.profiler.capacity - 1)
+            points = [
+                (graph.left + int(i * step),
+                 graph.bottom - min(self.graph_height, int(value * scale)))
+                for i, value in enumerate(times)
+            ]
+            pygame.draw.lines(surface, GREEN, False, points)
+        pygame.draw.rect(surface, (80, 80, 80), graph, 1)
+    
+    def draw(self, surface, x=10, y=50):
+        """Draw overlay if visible, returns rects drawn"""
+        if not self.visible:
+            return []
+        
+        self.frames_since_refresh += 1
+        if self.text_surface is None or self.frames_since_refresh >= self.refresh_frames:
+            self._render_text()
+            self.frames_since_refresh = 0
+        
+        rect = surface.blit(self.text_surface, (x, y))
+        self._draw_graph(surface, x, y + self.text_surface.get_height())
+        return [rect.union(pygame.Rect(x, rect.bottom, self.width, self.graph_height))]
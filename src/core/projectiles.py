@@ -1,12 +1,19 @@
 """
-Projectile Class
+Projectile Classes
 """
+import numpy as np
 import pygame
 from config import *
+from src.graphics.sprite_cache import sprite_cache
+
+
+# Projectile teams: who fired it, and therefore who it can hit
+TEAM_ENEMY = 0
+TEAM_PLAYER = 1
 
 
 class Projectile(pygame.sprite.Sprite):
-    """Projectile class for bullets and other projectiles"""
+    """Single projectile sprite (ProjectileSystem is used for bulk projectiles)"""
     
     def __init__(self, x, y, vx, vy, damage=10, color=WHITE):
         """Initialize projectile"""
@@ -14,13 +21,14 @@ class Projectile(pygame.sprite.Sprite):
         
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.vx = vx
         self.vy = vy
         self.damage = damage
         
-        # Graphics
-        self.image = pygame.Surface((8, 8), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, color, (4, 4), 4)
+        # Graphics (shared between all projectiles of the same color)
+        self.image = sprite_cache.get_projectile_sprite(color)
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
@@ -29,6 +37,8 @@ class Projectile(pygame.sprite.Sprite):
     
     def update(self):
         """Update projectile"""
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += self.vx
         self.y += self.vy
         self.rect.x = int(self.x)
@@ -38,6 +48,170 @@ class Projectile(pygame.sprite.Sprite):
         if self.lifetime <= 0:
             self.kill()
     
-    def draw(self, surface, camera_x=0, camera_y=0):
+    def draw(self, surface, camera_x=0, camera_y=0, alpha=1.0):
         """Draw projectile"""
-        surface.blit(self.image, (self.rect.x - camera_x, self.rect.y - camera_y))
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        surface.blit(self.image, (int(x - camera_x), int(y - camera_y)))
+
+
+class ProjectileSystem:
+    """Struct-of-arrays projectile storage updated with vectorized NumPy operations"""
+    
+    # Per-slot arrays
+    FIELDS = (
+        ('x', np.float64),
+        ('y', np.float64),
+        ('prev_x', np.float64),
+        ('prev_y', np.float64),
+        ('vx', np.float64),
+        ('vy', np.float64),
+        ('damage', np.float64),
+        ('lifetime', np.int32),
+        ('color_id', np.int16),
+        ('team', np.int8),
+        ('alive', np.bool_),
+    )
+    
+    # Sprite size in pixels (projectiles are square)
+    SIZE = 8
+    
+    def __init__(self, capacity=256):
+        """
+        Initialize projectile system
+        
+        Args:
+            capacity: Initial number of slots (grows by doubling when full)
+        """
+        self.capacity = 0
+        self.count = 0
+        self.colors = []  # Palette: color_id -> color
+        self._allocate(capacity)
+    
+    def _allocate(self, capacity):
+        """Resize slot arrays, keeping existing projectiles"""
+        for name, dtype in self.FIELDS:
+            array = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                array[:self.capacity] = getattr(self, name)
+            setattr(self, name, array)
+        self.capacity = capacity
+    
+    def _color_id(self, color):
+        """Get palette index for a color"""
+        color = tuple(color)
+        if color not in self.colors:
+            self.colors.append(color)
+        return self.colors.index(color)
+    
+    def _claim_slots(self, count):
+        """Get indices of free slots, growing storage if needed"""
+        if self.count + count > self.capacity:
+            capacity = self.capacity
+            while self.count + count > capacity:
+                capacity *= 2
+            self._allocate(capacity)
+        slots = np.flatnonzero(~self.alive)[:count]
+        self.count += count
+        return slots
+    
+    def spawn(self, x, y, vx, vy, damage=10, color=WHITE, lifetime=180, team=TEAM_ENEMY):
+        """Spawn a single projectile, returns its slot"""
+        return int(self.spawn_many([x], [y], [vx], [vy], damage, color, lifetime, team)[0])
+    
+    def spawn_many(self, x, y, vx, vy, damage=10, color=WHITE, lifetime=180, team=TEAM_ENEMY):
+        """
+        Spawn projectiles in bulk
+        
+        Args:
+            x, y, vx, vy: Sequences (or arrays) of equal length
+            damage, lifetime: Scalars or per-projectile sequences
+            color: Color shared by all spawned projectiles
+            team: TEAM_ENEMY or TEAM_PLAYER
+        
+        Returns:
+            Array of slots used
+        """
+        x = np.asarray(x, dtype=np.float64)
+        slots = self._claim_slots(len(x))
+        if not len(slots):
+            return slots
+        
+        self.x[slots] = x
+        self.y[slots] = y
+        self.prev_x[slots] = x
+        self.prev_y[slots] = y
+        self.vx[slots] = vx
+        self.vy[slots] = vy
+        self.damage[slots] = damage
+        self.lifetime[slots] = lifetime
+        self.color_id[slots] = self._color_id(color)
+        self.team[slots] = team
+        self.alive[slots] = True
+        return slots
+    
+    def kill(self, slots):
+        """Remove projectiles by slot index (or boolean mask)"""
+        slots = np.flatnonzero(self.alive & self._as_mask(slots))
+        self.alive[slots] = False
+        self.count -= len(slots)
+    
+    def _as_mask(self, slots):
+        """Convert slot indices to a boolean mask"""
+        slots = np.asarray(slots)
+        if slots.dtype == np.bool_:
+            return slots
+        mask = np.zeros(self.capacity, dtype=np.bool_)
+        mask[slots] = True
+        return mask
+    
+    def update(self):
+        """Advance all projectiles one tick"""
+        if not self.count:
+            return
+        
+        np.copyto(self.prev_x, self.x)
+        np.copyto(self.prev_y, self.y)
+        self.x += self.vx
+        self.y += self.vy
+        self.lifetime -= 1
+        
+        expired = self.alive & (self.lifetime <= 0)
+        if expired.any():
+            self.alive &= ~expired
+            self.count = int(np.count_nonzero(self.alive))
+    
+    def active_slots(self):
+        """Get indices of live projectiles"""
+        return np.flatnonzero(self.alive)
+    
+    def draw(self, surface, camera_x=0, camera_y=0, alpha=1.0):
+        """Draw all projectiles with one batched blit per color, returns rects drawn"""
+        if not self.count:
+            return []
+        
+        slots = self.active_slots()
+        prev_x = self.prev_x[slots]
+        prev_y = self.prev_y[slots]
+        xs = (prev_x + (self.x[slots] - prev_x) * alpha - camera_x).astype(np.int32)
+        ys = (prev_y + (self.y[slots] - prev_y) * alpha - camera_y).astype(np.int32)
+        color_ids = self.color_id[slots]
+        
+        rects = []
+        for color_id, color in enumerate(self.colors):
+            mask = color_ids == color_id
+            if not mask.any():
+                continue
+            sprite = sprite_cache.get_projectile_sprite(color)
+            positions = zip(xs[mask].tolist(), ys[mask].tolist())
+            rects += surface.blits([(sprite, position) for position in positions])
+        return rects
+    
+    def empty(self):
+        """Remove all projectiles"""
+        self.alive[:] = False
+        self.count = 0
+    
+    def __len__(self):
+        """Number of live projectiles"""
+        return self.count
@@ -3,15 +3,17 @@ Animation Panel
 """
 import pygame
 from config import *
+from src.editor.font_registry import font_registry
+from src.editor.resizable_panel import ResizablePanel
 from src.editor.animation_loader import animation_loader
 
 
-class AnimationPanel:
+class AnimationPanel(ResizablePanel):
     """Panel for managing animations"""
     
     def __init__(self, x, y, width, height):
         """Initialize animation panel"""
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height, "Animations")
         self.selected_animation = None
         self.scroll_offset = 0
     
@@ -23,10 +25,12 @@ class AnimationPanel:
                     self._select_animation(event.pos)
                 elif event.button == 4:  # Scroll up
                     self.scroll_offset = max(0, self.scroll_offset - 1)
+                    self.mark_dirty()
                 elif event.button == 5:  # Scroll down
                     animations = animation_loader.get_all_animations()
                     max_scroll = max(0, len(animations) - (self.rect.height - 30) // 30)
                     self.scroll_offset = min(max_scroll, self.scroll_offset + 1)
+                    self.mark_dirty()
     
     def _select_animation(self, pos):
         """Select animation at position"""
@@ -40,24 +44,28 @@ class AnimationPanel:
         
         if 0 <= index < len(animations):
             self.selected_animation = animations[index]
+            self.mark_dirty()
     
     def get_selected_animation(self):
         """Get currently selected animation"""
         return self.selected_animation
     
-    def draw(self, surface):
-        """Draw animation panel"""
+    def get_state(self):
+        """Re-render when animations are added"""
+        return len(animation_loader.get_all_animations())
+    
+    def render(self, surface):
+        """Render animation panel"""
         # Draw background
-        pygame.draw.rect(surface, (40, 40, 40), self.rect)
+        surface.fill((40, 40, 40))
         
         # Draw title
-        font = pygame.font.Font(None, 24)
-        title = font.render("Animations", True, WHITE)
-        surface.blit(title, (self.rect.x + 5, self.rect.y + 5))
+        title = font_registry.render("Animations", 24, WHITE)
+        surface.blit(title, (5, 5))
         
         # Draw animations list
         animations = animation_loader.get_all_animations()
-        y_offset = self.rect.y + 30
+        y_offset = 30
         
         for i, anim_name in enumerate(animations):
             row = i - self.scroll_offset
@@ -67,13 +75,13 @@ class AnimationPanel:
             
             y = y_offset + row * 30
             
-            if y > self.rect.bottom - 30:
+            if y > self.rect.height - 30:
                 break
             
             # Highlight selected
             color = GREEN if anim_name == self.selected_animation else WHITE
-            text = font.render(anim_name, True, color)
-            surface.blit(text, (self.rect.x + 10, y))
+            text = font_registry.render(anim_name, 24, color)
+            surface.blit(text, (10, y))
         
         # Draw border
-        pygame.draw.rect(surface, (80, 80, 80), self.rect, 1)
+        pygame.draw.rect(surface, (80, 80, 80), surface.get_rect(), 1)
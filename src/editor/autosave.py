@@ -0,0 +1,250 @@
+"""
+Background Level Saving and Edit Journal
+"""
+import copy
+import json
+import os
+import threading
+from config import *
+from src.editor.level_utils import LevelUtils
+
+
+JOURNAL_SUFFIX = ".journal"
+
+
+class EditJournal:
+    """
+    Append-only log of edits made since the last full save
+    
+    Every edit gets an increasing sequence number. A saved level stores
+    the sequence number it includes in metadata['journal_seq'], so after a
+    crash only newer edits are replayed, even if compaction never ran.
+    
+    Marker lines ({'base': 'file' or 'new', 'seq': n}) record what the
+    edits after them apply to: the saved level file or a fresh level.
+    Compaction leaves a 'file' marker at the saved sequence number, so
+    numbering continues across sessions without reading the level.
+    """
+    
+    def __init__(self, filename):
+        """Open journal, continuing after its last recorded edit"""
+        self.filename = filename
+        self.lock = threading.Lock()
+        self.file = None
+        self.marker = None  # Marker written before the next edit
+        self._truncate_partial_line()
+        self.seq = max((record['seq'] for record in self.records()), default=0)
+    
+    def _truncate_partial_line(self):
+        """Cut off a last line left unfinished by a crash mid-append"""
+        if not os.path.exists(self.filename):
+            return
+        with open(self.filename, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+    
+    def records(self):
+        """
+        Read journal lines (markers and edits)
+        
+        Lines that don't parse are skipped.
+        """
+        result = []
+        if not os.path.exists(self.filename):
+            return result
+        with open(self.filename, 'r') as f:
+            for line in f:
+                try:
+                    result.append(json.loads(line))
+                except ValueError:
+                    continue
+        return result
+    
+    def segment(self):
+        """
+        Read edits after the last marker
+        
+        Returns:
+            Tuple (base, base_seq, edits); journals without markers
+            apply to the level file
+        """
+        base, base_seq, edits = 'file', 0, []
+        for record in self.records():
+            if 'base' in record:
+                base, base_seq, edits = record['base'], record['seq'], []
+            else:
+                edits.append(record)
+        return base, base_seq, edits
+    
+    def start(self, base):
+        """
+        Start a new segment: following edits apply to base ('file' or 'new')
+        
+        The marker takes a sequence number now, so any level saved from
+        here on has journal_seq >= the marker's seq.
+        """
+        with self.lock:
+            self.seq += 1
+            self.marker = {'base': base, 'seq': self.seq}
+    
+    def _write(self, record):
+        """Write one journal line"""
+        if self.file is None:
+            self.file = open(self.filename, 'a')
+        self.file.write(json.dumps(record, separators=(',', ':')) + "\n")
+    
+    def _write_marker(self):
+        """Write the pending marker, if any"""
+        if self.marker:
+            self._write(self.marker)
+            self.marker = None
+    
+    def checkpoint(self):
+        """
+        Get the sequence number a save made now includes
+        
+        A pending marker is written first, so every saved journal_seq
+        is recorded in the journal even if compaction never runs.
+        """
+        with self.lock:
+            if self.marker:
+                self._write_marker()
+                self.file.flush()
+            return self.seq
+    
+    def append(self, edit):
+        """Append edit, returns its sequence number"""
+        with self.lock:
+            self._write_marker()
+            self.seq += 1
+            self._write(dict(edit, seq=self.seq))
+            self.file.flush()
+            return self.seq
+    
+    def compact(self, saved_seq):
+        """Drop edits already contained in a saved level"""
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+            
+            # The level file is the base of whatever follows the save
+            pending = [{'base': 'file', 'seq': saved_seq}]
+            pending += [record for record in self.records() if record['seq'] > saved_seq]
+            
+            temp = self.filename + ".tmp"
+            with open(temp, 'w') as f:
+                for record in pending:
+                    f.write(json.dumps(record, separators=(',', ':')) + "\n")
+            os.replace(temp, self.filename)
+    
+    def close(self):
+        """Close journal file"""
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+
+
+def snapshot_level(level_data):
+    """Deep copy of level data safe to serialize on another thread"""
+    snapshot = {key: copy.deepcopy(value) for key, value in level_data.items() if key != 'rooms'}
+    snapshot['rooms'] = [copy.deepcopy(room) for room in level_data.get('rooms', [])]
+    return snapshot
+
+
+def temp_filename(filename):
+    """Temp file next to filename, keeping the extension (format detection)"""
+    root, ext = os.path.splitext(filename)
+    return f"{root}.tmp{ext}"
+
+
+def write_atomic(level_data, filename, binary=None):
+    """Save level to a temp file, then atomically replace filename"""
+    temp = temp_filename(filename)
+    if not LevelUtils.save_level(level_data, temp, binary):
+        return False
+    with open(temp, 'rb+') as f:
+        os.fsync(f.fileno())
+    os.replace(temp, filename)
+    return True
+
+
+class SaveWorker:
+    """
+    Saves level snapshots on a background thread
+    
+    Only the newest pending snapshot is written; older requests that were
+    not started yet are superseded.
+    """
+    
+    def __init__(self, journal=None):
+        """Start worker thread"""
+        self.journal = journal
+        self.condition = threading.Condition()
+        self.pending = None  # (snapshot, filename, binary, seq)
+        self.busy = False
+        self.running = True
+        self.last_error = None
+        self.thread = threading.Thread(target=self._run, name="level-save", daemon=True)
+        self.thread.start()
+    
+    def save(self, level_data, filename, binary=None):
+        """Snapshot level and queue it for saving (binary as in LevelUtils.save_level)"""
+        seq = self.journal.checkpoint() if self.journal else 0
+        snapshot = snapshot_level(level_data)
+        metadata = dict(snapshot.get('metadata', {}))
+        metadata['journal_seq'] = seq
+        snapshot['metadata'] = metadata
+        
+        with self.condition:
+            self.pending = (snapshot, filename, binary, seq)
+            self.condition.notify_all()
+    
+    def _run(self):
+        """Worker loop"""
+        while True:
+            with self.condition:
+                while self.running and self.pending is None:
+                    self.condition.wait()
+                if self.pending is None:
+                    return
+                snapshot, filename, binary, seq = self.pending
+                self.pending = None
+                self.busy = True
+            
+            try:
+                if write_atomic(snapshot, filename, binary):
+                    if self.journal:
+                        self.journal.compact(seq)
+                    self.last_error = None
+                    print(f"Level saved to {filename}")
+                else:
+                    self.last_error = f"Could not save {filename}"
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Error saving level: {e}")
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+    
+    def is_saving(self):
+        """Check if a save is queued or in progress"""
+        with self.condition:
+            return self.busy or self.pending is not None
+    
+    def wait(self, timeout=None):
+        """Wait until queued saves are written"""
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: not self.busy and self.pending is None, timeout
+            )
+    
+    def stop(self):
+        """Finish queued saves and stop the worker"""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.thread.join()
@@ -3,14 +3,16 @@ Connections Panel
 """
 import pygame
 from config import *
+from src.editor.font_registry import font_registry
+from src.editor.resizable_panel import ResizablePanel
 
 
-class ConnectionsPanel:
+class ConnectionsPanel(ResizablePanel):
     """Panel for managing room connections"""
     
     def __init__(self, x, y, width, height):
         """Initialize connections panel"""
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height, "Connections")
         self.connections = []
         self.selected_connection = None
     
@@ -22,11 +24,13 @@ class ConnectionsPanel:
             'type': connection_type
         }
         self.connections.append(connection)
+        self.mark_dirty()
     
     def remove_connection(self, index):
         """Remove connection by index"""
         if 0 <= index < len(self.connections):
             self.connections.pop(index)
+            self.mark_dirty()
     
     def handle_event(self, event):
         """Handle panel events"""
@@ -46,30 +50,30 @@ class ConnectionsPanel:
         
         if 0 <= index < len(self.connections):
             self.selected_connection = index
+            self.mark_dirty()
     
-    def draw(self, surface):
-        """Draw connections panel"""
+    def render(self, surface):
+        """Render connections panel"""
         # Draw background
-        pygame.draw.rect(surface, (40, 40, 40), self.rect)
+        surface.fill((40, 40, 40))
         
         # Draw title
-        font = pygame.font.Font(None, 24)
-        title = font.render("Connections", True, WHITE)
-        surface.blit(title, (self.rect.x + 5, self.rect.y + 5))
+        title = font_registry.render("Connections", 24, WHITE)
+        surface.blit(title, (5, 5))
         
         # Draw connections list
-        y_offset = self.rect.y + 30
+        y_offset = 30
         
         for i, conn in enumerate(self.connections):
             y = y_offset + i * 25
             
-            if y > self.rect.bottom - 25:
+            if y > self.rect.height - 25:
                 break
             
             # Highlight selected
             color = GREEN if i == self.selected_connection else WHITE
-            text = font.render(f"{conn['from']} -> {conn['to']}", True, color)
-            surface.blit(text, (self.rect.x + 10, y))
+            text = font_registry.render(f"{conn['from']} -> {conn['to']}", 24, color)
+            surface.blit(text, (10, y))
         
         # Draw border
-        pygame.draw.rect(surface, (80, 80, 80), self.rect, 1)
+        pygame.draw.rect(surface, (80, 80, 80), surface.get_rect(), 1)
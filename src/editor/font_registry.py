@@ -0,0 +1,21 @@
+"""
+Font Registry - shared fonts and rendered labels for editor panels
+"""
+from config import *
+from src.ui.hud import TextCache
+
+
+class FontRegistry:
+    """Caches rendered labels; fonts come from the shared HUD font cache"""
+    
+    def __init__(self, capacity=EDITOR_LABEL_CACHE_SIZE):
+        """Initialize font registry"""
+        self.labels = TextCache(capacity)
+    
+    def render(self, text, size, color=WHITE):
+        """Get rendered label surface"""
+        return self.labels.render(text, size, color)
+
+
+# Global font registry instance
+font_registry = FontRegistry()
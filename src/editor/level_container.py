@@ -0,0 +1,145 @@
+"""
+Lazy Level Container
+"""
+import threading
+from collections import deque
+from collections.abc import Sequence
+from config import *
+from src.editor import level_format
+
+
+class LazyRooms(Sequence):
+    """
+    Room list of a binary level that decodes rooms on first access
+    
+    Only the room index is read up front. A background thread can
+    prefetch rooms reachable through the level's connections so that
+    moving to a neighbouring room does not wait on disk.
+    """
+    
+    def __init__(self, level_file, connections=()):
+        """
+        Args:
+            level_file: Opened level_format.LevelFile
+            connections: Level connections ({'from': ..., 'to': ...})
+        """
+        self.level_file = level_file
+        self.connections = list(connections)
+        self.rooms = {}  # index: decoded room
+        self.lock = threading.Lock()
+        self.prefetch_thread = None
+        self.stop_event = threading.Event()
+        self._names = None
+    
+    def __len__(self):
+        """Number of rooms"""
+        return len(self.level_file)
+    
+    def __getitem__(self, index):
+        """Get room, decoding it if needed"""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("room index out of range")
+        
+        with self.lock:
+            room = self.rooms.get(index)
+            if room is None:
+                room = self.level_file.read_room(index)
+                self.rooms[index] = room
+            return room
+    
+    def is_loaded(self, index):
+        """Check if room was already decoded"""
+        return index in self.rooms
+    
+    def room_index(self, ref):
+        """Resolve a connection endpoint (room index or room name) to an index"""
+        if isinstance(ref, int):
+            return ref if 0 <= ref < len(self) else None
+        if self._names is None:
+            self._names = {
+                self.level_file.read_room_header(i).get('name'): i
+                for i in range(len(self))
+            }
+        return self._names.get(ref)
+    
+    def neighbours(self, index):
+        """Indices of rooms connected to a room"""
+        result = []
+        for connection in self.connections:
+            ends = [self.room_index(connection.get('from')), self.room_index(connection.get('to'))]
+            if index in ends:
+                result.extend(end for end in ends if end is not None and end != index)
+        return result
+    
+    def prefetch(self, start=0):
+        """Start decoding rooms reachable from start in a background thread"""
+        self.stop_prefetch()
+        self.stop_event.clear()
+        self.prefetch_thread = threading.Thread(
+            target=self._prefetch, args=(start,), name="level-prefetch", daemon=True
+        )
+        self.prefetch_thread.start()
+    
+    def _prefetch(self, start):
+        """Breadth-first walk over connections, nearest rooms first"""
+        try:
+            visited = {start}
+            queue = deque(self.neighbours(start))
+            while queue and not self.stop_event.is_set():
+                index = queue.popleft()
+                if index in visited:
+                    continue
+                visited.add(index)
+                
+                self.level_file.advise_room(index)
+                self[index]
+                queue.extend(self.neighbours(index))
+        except Exception as e:
+            print(f"Error prefetching rooms: {e}")
+    
+    def wait_prefetch(self, timeout=None):
+        """Wait for the prefetch thread to finish"""
+        if self.prefetch_thread:
+            self.prefetch_thread.join(timeout)
+    
+    def stop_prefetch(self):
+        """Stop the prefetch thread"""
+        if self.prefetch_thread and self.prefetch_thread.is_alive():
+            self.stop_event.set()
+            self.prefetch_thread.join()
+        self.prefetch_thread = None
+    
+    def close(self):
+        """Stop prefetching and unmap the level file; rooms can't be read afterwards"""
+        self.stop_prefetch()
+        with self.lock:
+            self.rooms.clear()
+        self.level_file.close()
+
+
+def open_binary_level(filename, prefetch_from=0):
+    """
+    Open binary level for lazy room access
+    
+    Only the room index is read; rooms are decoded on first access and
+    neighbours of prefetch_from are prefetched in background.
+    
+    Args:
+        filename: Binary level file path
+        prefetch_from: Room to prefetch around, None to disable
+    
+    Returns:
+        Level data dict with a LazyRooms sequence as 'rooms'
+    """
+    level_file = level_format.LevelFile(filename)
+    level_data = dict(level_file.metadata)
+    rooms = LazyRooms(level_file, level_data.get('connections', []))
+    level_data['rooms'] = rooms
+    
+    if prefetch_from is not None and len(rooms):
+        rooms.prefetch(prefetch_from)
+    return level_data
@@ -3,6 +3,7 @@ Level Editor Main
 """
 import pygame
 from config import *
+from src.editor.font_registry import font_registry
 from src.editor.texture_loader import texture_loader
 from src.editor.texture_panel import TexturePanel
 from src.editor.animation_panel import AnimationPanel
@@ -11,7 +12,9 @@ from src.editor.room_editor import RoomEditor
 from src.editor.connections_panel import ConnectionsPanel
 from src.editor.minimap_panel import MinimapPanel
 from src.editor.properties_panel import PropertiesPanel
+from src.editor import level_format
 from src.editor.level_utils import LevelUtils
+from src.editor.autosave import EditJournal, SaveWorker, JOURNAL_SUFFIX
 from src.editor.undo_redo import HistoryManager
 
 
@@ -24,14 +27,23 @@ class LevelEditor:
         pygame.display.set_caption("MMMGame - Level Editor")
         self.clock = pygame.time.Clock()
         self.running = True
+        self.needs_redraw = True
         
         # Editor state
         self.current_level = LevelUtils.create_new_level()
+        self.current_room = 0
+        self.level_filename = "level.json"
+        self.level_binary = level_format.is_binary_level(self.level_filename)  # Format to save in
         self.history = HistoryManager()
         
         # Room editor
         self.room_editor = RoomEditor()
         
+        # Background saving; edits since the last save go to the journal
+        self._open_journal()
+        self.save_worker = SaveWorker(self.journal)
+        self.room_editor.on_edit = self._record_edit
+        
         # UI Panels
         panel_width = 200
         self.texture_panel = TexturePanel(
@@ -71,8 +83,18 @@ class LevelEditor:
             150
         )
         
-        # Editor view
+        self.panels = [
+            self.tabs_panel,
+            self.texture_panel,
+            self.animation_panel,
+            self.properties_panel,
+            self.minimap_panel,
+            self.connections_panel,
+        ]
+        
+        # Editor view (room editor draws straight into this part of the screen)
         self.view_rect = pygame.Rect(0, 30, SCREEN_WIDTH - panel_width, SCREEN_HEIGHT - 30)
+        self.view_surface = self.screen.subsurface(self.view_rect)
         
         # Initialize
         texture_loader.scan_assets_directory()
@@ -80,6 +102,9 @@ class LevelEditor:
     def handle_events(self):
         """Handle editor events"""
         for event in pygame.event.get():
+            # Any input may change what is on screen
+            self.needs_redraw = True
+            
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -111,7 +136,7 @@ class LevelEditor:
                     # Adjust event position to room editor coordinates
                     adjusted_event = pygame.event.Event(
                         event.type,
-                        {'pos': (event.pos[0] - self.view_rect.x, 
+                        {'pos': (event.pos[0] - self.view_rect.x,
                                 event.pos[1] - self.view_rect.y),
                          'button': event.button}
                     )
@@ -121,8 +146,9 @@ class LevelEditor:
         """Update editor state"""
         # Update selected texture from panel
         selected_texture = self.texture_panel.get_selected_texture()
-        if selected_texture:
+        if selected_texture and selected_texture != self.room_editor.current_texture:
             self.room_editor.set_current_texture(selected_texture)
+            self.needs_redraw = True
         
         # Update camera with arrow keys
         keys = pygame.key.get_pressed()
@@ -136,6 +162,13 @@ class LevelEditor:
             self.room_editor.camera_y -= camera_speed
         if keys[pygame.K_DOWN]:
             self.room_editor.camera_y += camera_speed
+        
+        if keys[pygame.K_LEFT] or keys[pygame.K_RIGHT] or keys[pygame.K_UP] or keys[pygame.K_DOWN]:
+            self.needs_redraw = True
+        
+        # Panels whose external data changed (e.g. new textures) need a frame too
+        if any(panel.needs_render() for panel in self.panels):
+            self.needs_redraw = True
     
     def draw(self):
         """Draw editor"""
@@ -145,11 +178,9 @@ class LevelEditor:
         self.tabs_panel.draw(self.screen)
         
         # Draw room editor in view area
-        view_surface = pygame.Surface((self.view_rect.width, self.view_rect.height))
-        self.room_editor.draw(view_surface, self.view_rect)
-        self.screen.blit(view_surface, (self.view_rect.x, self.view_rect.y))
+        self.room_editor.draw(self.view_surface, self.view_rect)
         
-        # Draw panels
+        # Draw panels (each blits its cached surface unless marked dirty)
         self.texture_panel.draw(self.screen)
         self.animation_panel.draw(self.screen)
         self.properties_panel.draw(self.screen)
@@ -160,38 +191,80 @@ class LevelEditor:
         self._draw_status_bar()
         
         pygame.display.flip()
+        self.needs_redraw = False
     
     def _draw_status_bar(self):
         """Draw status bar"""
-        font = pygame.font.Font(None, 20)
-        
         # Tool info
         tool_text = f"Tool: {self.room_editor.current_tool}"
-        text = font.render(tool_text, True, WHITE)
+        text = font_registry.render(tool_text, 20, WHITE)
         self.screen.blit(text, (10, SCREEN_HEIGHT - 25))
         
         # Grid toggle info
         grid_text = f"Grid: {'ON' if self.room_editor.show_grid else 'OFF'} (G)"
-        text = font.render(grid_text, True, WHITE)
+        text = font_registry.render(grid_text, 20, WHITE)
         self.screen.blit(text, (150, SCREEN_HEIGHT - 25))
     
+    def _record_edit(self, edit):
+        """Append room edit to the autosave journal"""
+        self.journal.append(dict(edit, room=self.current_room))
+    
+    def _open_journal(self):
+        """Open the autosave journal and replay edits a crashed session did not save"""
+        self.journal = EditJournal(self.level_filename + JOURNAL_SUFFIX)
+        base, base_seq, edits = self.journal.segment()
+        edits = [edit for edit in edits if edit.get('room', 0) == 0]
+        
+        # The level is only read when there is something to replay; a save
+        # that crashed before compaction may already contain some edits
+        level_data = None
+        saved_seq = 0
+        if edits:
+            level_data = LevelUtils.load_level(self.level_filename)
+            if level_data and LevelUtils.validate_level(level_data):
+                saved_seq = level_data.get('metadata', {}).get('journal_seq', 0)
+                if saved_seq > self.journal.seq:
+                    # Saved under a different journal's numbering
+                    saved_seq = 0
+            else:
+                level_data = None
+            edits = [edit for edit in edits if edit['seq'] > saved_seq]
+        
+        if not edits:
+            # The editor starts with a fresh level
+            self.journal.start('new')
+            return
+        
+        # Replay on the saved file, unless the edits were made on a fresh level that was never saved
+        if level_data and (base == 'file' or saved_seq >= base_seq):
+            self.current_level = level_data
+            if level_data.get('rooms'):
+                self.room_editor.import_data(level_data['rooms'][0])
+        
+        for edit in edits:
+            self.room_editor.apply_edit(edit, notify=False)
+        print(f"Recovered {len(edits)} unsaved edits from {self.journal.filename}")
+    
     def _save_level(self):
-        """Save current level"""
-        # Update level data
-        self.current_level['rooms'] = [self.room_editor.export_data()]
-        
-        # Save to file
-        filename = "level.json"
-        if LevelUtils.save_level(self.current_level, filename):
-            print(f"Level saved to {filename}")
+        """Save current level in background"""
+        # Update level data (grid form keeps the snapshot cheap)
+        rooms = [self.room_editor.export_grid_data()]
+        LevelUtils.close_level(self.current_level)
+        self.current_level['rooms'] = rooms
+        
+        # Snapshot now, write on the save worker in the format the level was opened in
+        self.save_worker.save(self.current_level, self.level_filename, self.level_binary)
     
     def _load_level(self):
         """Load level from file"""
-        filename = "level.json"
-        level_data = LevelUtils.load_level(filename)
+        filename = self.level_filename
+        level_data = LevelUtils.open_level(filename)
         
         if level_data and LevelUtils.validate_level(level_data):
+            LevelUtils.close_level(self.current_level)
             self.current_level = level_data
+            self.level_binary = level_format.is_binary_level(filename)
+            self.journal.start('file')
             
             # Load first room if available
             if level_data.get('rooms'):
@@ -218,5 +291,15 @@ class LevelEditor:
         while self.running:
             self.handle_events()
             self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            
+            # Nothing changed: keep the last frame and poll at a low rate
+            if self.needs_redraw:
+                self.draw()
+                self.clock.tick(FPS)
+            else:
+                self.clock.tick(EDITOR_IDLE_FPS)
+        
+        # Let a queued save finish before exiting
+        self.save_worker.stop()
+        self.journal.close()
+        LevelUtils.close_level(self.current_level)
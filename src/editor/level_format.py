@@ -0,0 +1,294 @@
+"""
+Binary Level Format
+
+Compact alternative to JSON levels. All integers are little-endian.
+    
+    header      magic "MMML", version, flags, room count,
+                offsets of the string table, metadata and room index
+    strings     texture names, referenced by tile ids (id = index + 1, 0 = empty)
+    metadata    JSON of every level key except 'rooms'
+    room index  (offset, size) of each room block
+    rooms       JSON room header, uint16 tile grid [height, width],
+                JSON list of sparse [x, y, properties] overrides
+
+Rooms read from a binary file carry 'grid' (read-only view into the
+memory-mapped file), 'palette' and 'properties' instead of 'tiles';
+use room_tiles() to walk tiles of either form.
+
+Usage:
+    python -m src.editor.level_format to-binary level.json level.lvl
+    python -m src.editor.level_format to-json level.lvl level.json
+"""
+import json
+import mmap
+import struct
+import sys
+import numpy as np
+from config import *
+
+
+MAGIC = b"MMML"
+FORMAT_VERSION = 1
+BINARY_EXTENSION = ".lvl"
+
+# magic, version, flags, room count, strings offset, metadata offset, index offset
+HEADER = struct.Struct("<4sHHIQQQ")
+COUNT = struct.Struct("<I")
+STRING_LENGTH = struct.Struct("<H")
+ROOM_ENTRY = struct.Struct("<QQ")
+ROOM_SIZE = struct.Struct("<HH")
+
+# Room keys stored outside the JSON room header
+GRID_KEYS = ('tiles', 'grid', 'palette', 'properties')
+
+
+def is_binary_level(filename):
+    """Check if file starts with the binary level magic"""
+    try:
+        with open(filename, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def room_tiles(room):
+    """
+    Iterate tiles of a room in either JSON or binary form
+    
+    Yields:
+        (x, y, {'texture': name, 'properties': dict}) triples
+    """
+    if 'grid' not in room:
+        yield from room.get('tiles', [])
+        return
+    
+    palette = room['palette']
+    properties = {(x, y): props for x, y, props in room.get('properties', [])}
+    ys, xs = np.nonzero(room['grid'])
+    ids = room['grid'][ys, xs].tolist()
+    for x, y, texture_id in zip(xs.tolist(), ys.tolist(), ids):
+        yield x, y, {
+            'texture': palette[texture_id],
+            'properties': properties.get((x, y), {})
+        }
+
+
+def expand_room(room):
+    """Convert a room to the JSON form with a 'tiles' list"""
+    if 'grid' not in room:
+        return room
+    data = {key: value for key, value in room.items() if key not in GRID_KEYS}
+    data['tiles'] = list(room_tiles(room))
+    return data
+
+
+def _room_grid(room, string_ids):
+    """Build uint16 grid and sparse properties of a room using global string ids"""
+    width = room.get('width', 20)
+    height = room.get('height', 15)
+    
+    if 'grid' in room:
+        # Remap the room palette to global ids in one lookup
+        lookup = np.array(
+            [0] + [string_ids.get(name, 0) for name in room['palette'][1:]],
+            dtype=np.uint16
+        )
+        grid = lookup[room['grid']]
+        properties = [list(entry) for entry in room.get('properties', [])]
+        return np.ascontiguousarray(grid, dtype='<u2'), properties
+    
+    grid = np.zeros((height, width), dtype='<u2')
+    properties = []
+    for x, y, tile_data in room.get('tiles', []):
+        if 0 <= x < width and 0 <= y < height:
+            grid[y, x] = string_ids[tile_data['texture']]
+            if tile_data.get('properties'):
+                properties.append([x, y, tile_data['properties']])
+    return grid, properties
+
+
+def _collect_strings(rooms):
+    """Collect texture names used by all rooms, in first-use order"""
+    names = {}
+    for room in rooms:
+        if 'grid' in room:
+            used = np.unique(room['grid']).tolist()
+            for texture_id in used:
+                if texture_id:
+                    names.setdefault(room['palette'][texture_id], None)
+        else:
+            for _, _, tile_data in room.get('tiles', []):
+                names.setdefault(tile_data['texture'], None)
+    return list(names)
+
+
+def _json_block(data):
+    """Encode data as length-prefixed compact JSON"""
+    encoded = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    return COUNT.pack(len(encoded)) + encoded
+
+
+def encode_room(room, string_ids):
+    """Encode a single room block"""
+    header = {key: value for key, value in room.items() if key not in GRID_KEYS}
+    grid, properties = _room_grid(room, string_ids)
+    
+    block = bytearray(_json_block(header))
+    block += ROOM_SIZE.pack(grid.shape[1], grid.shape[0])
+    block += grid.tobytes()
+    block += _json_block(properties)
+    return bytes(block)
+
+
+def write_level(level_data, filename):
+    """Write level in binary format"""
+    rooms = level_data.get('rooms', [])
+    strings = _collect_strings(rooms)
+    string_ids = {name: i + 1 for i, name in enumerate(strings)}
+    
+    string_table = bytearray(COUNT.pack(len(strings)))
+    for name in strings:
+        encoded = name.encode('utf-8')
+        string_table += STRING_LENGTH.pack(len(encoded)) + encoded
+    
+    metadata = _json_block({key: value for key, value in level_data.items() if key != 'rooms'})
+    room_blocks = [encode_room(room, string_ids) for room in rooms]
+    
+    strings_offset = HEADER.size
+    metadata_offset = strings_offset + len(string_table)
+    index_offset = metadata_offset + len(metadata)
+    offset = index_offset + ROOM_ENTRY.size * len(room_blocks)
+    
+    index = bytearray()
+    for block in room_blocks:
+        index += ROOM_ENTRY.pack(offset, len(block))
+        offset += len(block)
+    
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(room_blocks),
+                            strings_offset, metadata_offset, index_offset))
+        f.write(string_table)
+        f.write(metadata)
+        f.write(index)
+        for block in room_blocks:
+            f.write(block)
+
+
+class LevelFile:
+    """Memory-mapped binary level; rooms are decoded on request"""
+    
+    def __init__(self, filename):
+        """Map file and read header, string table, metadata and room index"""
+        self.filename = filename
+        with open(filename, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        (magic, version, _, room_count, strings_offset,
+         metadata_offset, index_offset) = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{filename} is not a binary level")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"Unsupported level format version {version}")
+        self.version = version
+        
+        # String table (palette shared by every room)
+        count, = COUNT.unpack_from(self.buffer, strings_offset)
+        position = strings_offset + COUNT.size
+        self.palette = [None]
+        for _ in range(count):
+            length, = STRING_LENGTH.unpack_from(self.buffer, position)
+            position += STRING_LENGTH.size
+            self.palette.append(bytes(self.buffer[position:position + length]).decode('utf-8'))
+            position += length
+        
+        self.metadata, _ = self._read_json(metadata_offset)
+        self.room_index = [
+            ROOM_ENTRY.unpack_from(self.buffer, index_offset + i * ROOM_ENTRY.size)
+            for i in range(room_count)
+        ]
+    
+    def _read_json(self, offset):
+        """Read length-prefixed JSON, returns (data, end offset)"""
+        length, = COUNT.unpack_from(self.buffer, offset)
+        start = offset + COUNT.size
+        return json.loads(bytes(self.buffer[start:start + length])), start + length
+    
+    def __len__(self):
+        """Number of rooms"""
+        return len(self.room_index)
+    
+    def read_room_header(self, index):
+        """Decode only the JSON header of a room (name, size, objects...)"""
+        offset, _ = self.room_index[index]
+        room, _ = self._read_json(offset)
+        return room
+    
+    def advise_room(self, index):
+        """Ask the OS to start paging in a room block"""
+        if not hasattr(self.buffer, 'madvise') or not hasattr(mmap, 'MADV_WILLNEED'):
+            return
+        offset, size = self.room_index[index]
+        start = offset - offset % mmap.PAGESIZE
+        self.buffer.madvise(mmap.MADV_WILLNEED, start, offset + size - start)
+    
+    def read_room(self, index):
+        """Decode room; its grid is a read-only view into the mapped file"""
+        offset, _ = self.room_index[index]
+        room, position = self._read_json(offset)
+        width, height = ROOM_SIZE.unpack_from(self.buffer, position)
+        position += ROOM_SIZE.size
+        
+        grid = np.frombuffer(self.buffer, dtype='<u2', count=width * height, offset=position)
+        room['grid'] = grid.reshape(height, width)
+        room['palette'] = self.palette
+        room['properties'], _ = self._read_json(position + grid.nbytes)
+        return room
+    
+    def read_level(self):
+        """Decode metadata and every room"""
+        level_data = dict(self.metadata)
+        level_data['rooms'] = [self.read_room(i) for i in range(len(self))]
+        return level_data
+    
+    def close(self):
+        """Unmap the file"""
+        try:
+            self.buffer.close()
+        except BufferError:
+            # Decoded grids are still in use; the mapping goes away with them
+            pass
+
+
+def read_level(filename):
+    """Read binary level file"""
+    return LevelFile(filename).read_level()
+
+
+def json_to_binary(json_filename, binary_filename):
+    """Convert JSON level to binary format"""
+    with open(json_filename, 'r') as f:
+        write_level(json.load(f), binary_filename)
+
+
+def binary_to_json(binary_filename, json_filename):
+    """Convert binary level to JSON format"""
+    level_data = read_level(binary_filename)
+    level_data['rooms'] = [expand_room(room) for room in level_data['rooms']]
+    with open(json_filename, 'w') as f:
+        json.dump(level_data, f, indent=2)
+
+
+def main(argv=None):
+    """Command line entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+    commands = {'to-binary': json_to_binary, 'to-json': binary_to_json}
+    if len(argv) != 3 or argv[0] not in commands:
+        print(__doc__.split("Usage:")[1].rstrip())
+        return 1
+    commands[argv[0]](argv[1], argv[2])
+    print(f"Converted {argv[1]} -> {argv[2]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
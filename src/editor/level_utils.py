@@ -4,15 +4,32 @@ Level Editor Utilities
 import json
 import os
 from config import *
+from src.editor import level_format
+from src.editor.level_container import LazyRooms, open_binary_level
 
 
 class LevelUtils:
     """Utility functions for level editor"""
     
     @staticmethod
-    def save_level(level_data, filename):
-        """Save level to JSON file"""
+    def save_level(level_data, filename, binary=None):
+        """
+        Save level to JSON file (binary format for .lvl files)
+        
+        Args:
+            level_data: Level data dict
+            filename: Output file path
+            binary: Force binary (True) or JSON (False) format, None = by extension
+        """
+        if binary is None:
+            binary = filename.endswith(level_format.BINARY_EXTENSION)
         try:
+            if binary:
+                level_format.write_level(level_data, filename)
+                return True
+            
+            level_data = dict(level_data)
+            level_data['rooms'] = [level_format.expand_room(room) for room in level_data.get('rooms', [])]
             with open(filename, 'w') as f:
                 json.dump(level_data, f, indent=2)
             return True
@@ -22,9 +39,11 @@ class LevelUtils:
     
     @staticmethod
     def load_level(filename):
-        """Load level from JSON file"""
+        """Load level from JSON or binary file (detected by header)"""
         try:
             if os.path.exists(filename):
+                if level_format.is_binary_level(filename):
+                    return level_format.read_level(filename)
                 with open(filename, 'r') as f:
                     return json.load(f)
             return None
@@ -32,6 +51,36 @@ class LevelUtils:
             print(f"Error loading level: {e}")
             return None
     
+    @staticmethod
+    def open_level(filename, prefetch_from=0):
+        """
+        Open level for editing or playing one room at a time
+        
+        Binary levels are opened lazily (see LazyRooms); JSON levels have
+        no room index and are parsed in full.
+        
+        Args:
+            filename: Level file path
+            prefetch_from: Room to prefetch neighbours of, None to disable
+        
+        Returns:
+            Level data dict or None on error
+        """
+        try:
+            if os.path.exists(filename) and level_format.is_binary_level(filename):
+                return open_binary_level(filename, prefetch_from)
+        except Exception as e:
+            print(f"Error loading level: {e}")
+            return None
+        return LevelUtils.load_level(filename)
+    
+    @staticmethod
+    def close_level(level_data):
+        """Stop background work of a lazily opened level and unmap its file"""
+        rooms = level_data.get('rooms') if level_data else None
+        if isinstance(rooms, LazyRooms):
+            rooms.close()
+    
     @staticmethod
     def validate_level(level_data):
         """Validate level data structure"""
@@ -3,14 +3,17 @@ Minimap Panel
 """
 import pygame
 from config import *
+from src.editor.font_registry import font_registry
+from src.editor.resizable_panel import ResizablePanel
 
 
-class MinimapPanel:
+class MinimapPanel(ResizablePanel):
     """Panel showing minimap of the level"""
     
     def __init__(self, x, y, width, height):
         """Initialize minimap panel"""
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height, "Minimap")
+        self.level_data = None
         self.zoom = 0.1
         self.offset_x = 0
         self.offset_y = 0
@@ -18,38 +21,48 @@ class MinimapPanel:
     def set_zoom(self, zoom):
         """Set minimap zoom level"""
         self.zoom = max(0.05, min(1.0, zoom))
+        self.mark_dirty()
     
     def handle_event(self, event):
         """Handle panel events"""
         if event.type == pygame.MOUSEWHEEL:
             if self.rect.collidepoint(pygame.mouse.get_pos()):
-                self.zoom += event.y * 0.05
-                self.zoom = max(0.05, min(1.0, self.zoom))
+                self.set_zoom(self.zoom + event.y * 0.05)
+    
+    def get_state(self):
+        """Re-render when a different level or room count is shown"""
+        if self.level_data is None:
+            return None
+        return id(self.level_data), len(self.level_data.get('rooms', []))
     
     def draw(self, surface, level_data=None):
         """Draw minimap panel"""
+        self.level_data = level_data
+        super().draw(surface)
+    
+    def render(self, surface):
+        """Render minimap panel"""
         # Draw background
-        pygame.draw.rect(surface, (30, 30, 30), self.rect)
+        surface.fill((30, 30, 30))
         
         # Draw title
-        font = pygame.font.Font(None, 20)
-        title = font.render("Minimap", True, WHITE)
-        surface.blit(title, (self.rect.x + 5, self.rect.y + 5))
+        title = font_registry.render("Minimap", 20, WHITE)
+        surface.blit(title, (5, 5))
         
         # Draw minimap content
         content_rect = pygame.Rect(
-            self.rect.x + 5,
-            self.rect.y + 25,
+            5,
+            25,
             self.rect.width - 10,
             self.rect.height - 30
         )
         pygame.draw.rect(surface, BLACK, content_rect)
         
         # Draw level data if available
-        if level_data:
+        if self.level_data:
             # TODO: Implement minimap rendering
             pass
         
         # Draw border
-        pygame.draw.rect(surface, (80, 80, 80), self.rect, 1)
+        pygame.draw.rect(surface, (80, 80, 80), surface.get_rect(), 1)
         pygame.draw.rect(surface, (60, 60, 60), content_rect, 1)
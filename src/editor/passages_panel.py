@@ -3,14 +3,16 @@ Passages Panel
 """
 import pygame
 from config import *
+from src.editor.font_registry import font_registry
+from src.editor.resizable_panel import ResizablePanel
 
 
-class PassagesPanel:
+class PassagesPanel(ResizablePanel):
     """Panel for managing room passages/doors"""
     
     def __init__(self, x, y, width, height):
         """Initialize passages panel"""
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height, "Passages")
         self.passages = []
         self.selected_passage = None
     
@@ -23,11 +25,13 @@ class PassagesPanel:
             'target': target_room
         }
         self.passages.append(passage)
+        self.mark_dirty()
     
     def remove_passage(self, index):
         """Remove passage by index"""
         if 0 <= index < len(self.passages):
             self.passages.pop(index)
+            self.mark_dirty()
     
     def handle_event(self, event):
         """Handle panel events"""
@@ -47,34 +51,34 @@ class PassagesPanel:
         
         if 0 <= index < len(self.passages):
             self.selected_passage = index
+            self.mark_dirty()
     
-    def draw(self, surface):
-        """Draw passages panel"""
+    def render(self, surface):
+        """Render passages panel"""
         # Draw background
-        pygame.draw.rect(surface, (40, 40, 40), self.rect)
+        surface.fill((40, 40, 40))
         
         # Draw title
-        font = pygame.font.Font(None, 24)
-        title = font.render("Passages", True, WHITE)
-        surface.blit(title, (self.rect.x + 5, self.rect.y + 5))
+        title = font_registry.render("Passages", 24, WHITE)
+        surface.blit(title, (5, 5))
         
         # Draw passages list
-        y_offset = self.rect.y + 30
+        y_offset = 30
         
         for i, passage in enumerate(self.passages):
             y = y_offset + i * 25
             
-            if y > self.rect.bottom - 25:
+            if y > self.rect.height - 25:
                 break
             
             # Highlight selected
             color = GREEN if i == self.selected_passage else WHITE
-            text = font.render(
+            text = font_registry.render(
                 f"{passage['direction']} at ({passage['x']}, {passage['y']})",
-                True,
+                24,
                 color
             )
-            surface.blit(text, (self.rect.x + 10, y))
+            surface.blit(text, (10, y))
         
         # Draw border
-        pygame.draw.rect(surface, (80, 80, 80), self.rect, 1)
+        pygame.draw.rect(surface, (80, 80, 80), surface.get_rect(), 1)
@@ -3,14 +3,16 @@ Properties Panel
 """
 import pygame
 from config import *
+from src.editor.font_registry import font_registry
+from src.editor.resizable_panel import ResizablePanel
 
 
-class PropertiesPanel:
+class PropertiesPanel(ResizablePanel):
     """Panel for editing object properties"""
     
     def __init__(self, x, y, width, height):
         """Initialize properties panel"""
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height, "Properties")
         self.selected_object = None
         self.properties = {}
     
@@ -18,32 +20,32 @@ class PropertiesPanel:
         """Set currently selected object and its properties"""
         self.selected_object = obj
         self.properties = properties.copy() if properties else {}
+        self.mark_dirty()
     
     def handle_event(self, event):
         """Handle panel events"""
         # TODO: Implement property editing
         pass
     
-    def draw(self, surface):
-        """Draw properties panel"""
+    def render(self, surface):
+        """Render properties panel"""
         # Draw background
-        pygame.draw.rect(surface, (40, 40, 40), self.rect)
+        surface.fill((40, 40, 40))
         
         # Draw title
-        font = pygame.font.Font(None, 24)
-        title = font.render("Properties", True, WHITE)
-        surface.blit(title, (self.rect.x + 5, self.rect.y + 5))
+        title = font_registry.render("Properties", 24, WHITE)
+        surface.blit(title, (5, 5))
         
         # Draw properties
         if self.properties:
-            y_offset = self.rect.y + 35
+            y_offset = 35
             for key, value in self.properties.items():
-                text = font.render(f"{key}: {value}", True, WHITE)
-                surface.blit(text, (self.rect.x + 10, y_offset))
+                text = font_registry.render(f"{key}: {value}", 24, WHITE)
+                surface.blit(text, (10, y_offset))
                 y_offset += 25
         else:
-            no_sel = font.render("No selection", True, GRAY)
-            surface.blit(no_sel, (self.rect.x + 10, self.rect.y + 35))
+            no_sel = font_registry.render("No selection", 24, GRAY)
+            surface.blit(no_sel, (10, 35))
         
         # Draw border
-        pygame.draw.rect(surface, (80, 80, 80), self.rect, 1)
+        pygame.draw.rect(surface, (80, 80, 80), surface.get_rect(), 1)
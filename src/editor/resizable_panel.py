@@ -3,10 +3,18 @@ Resizable Panel Base Class
 """
 import pygame
 from config import *
+from src.editor.font_registry import font_registry
 
 
 class ResizablePanel:
-    """Base class for resizable panels"""
+    """
+    Base class for resizable panels
+    
+    Panels are retained-mode: render() draws the panel into an off-screen
+    surface in local coordinates, and draw() only re-renders it after
+    mark_dirty() or when get_state() changes, otherwise it just blits the
+    cached surface.
+    """
     
     def __init__(self, x, y, width, height, title="Panel"):
         """Initialize resizable panel"""
@@ -23,6 +31,11 @@ class ResizablePanel:
         self.border_color = (80, 80, 80)
         self.title_color = (60, 60, 60)
         self.text_color = WHITE
+        
+        # Retained rendering
+        self.cache = None
+        self.dirty = True
+        self.state = None
     
     def handle_event(self, event):
         """Handle panel events"""
@@ -66,23 +79,52 @@ class ResizablePanel:
         elif self.resize_edge == "bottom":
             new_height = max(self.min_height, y - self.rect.top)
             self.rect.height = new_height
+        self.mark_dirty()
+    
+    def mark_dirty(self):
+        """Request re-render of the cached panel surface"""
+        self.dirty = True
+    
+    def get_state(self):
+        """
+        Snapshot of external state the panel displays
+        
+        Subclasses showing data they don't own (e.g. global loaders)
+        return a comparable value here; a change triggers a re-render.
+        """
+        return None
+    
+    def needs_render(self):
+        """Check if the next draw() will re-render the panel"""
+        return (self.dirty or self.cache is None or
+                self.cache.get_size() != self.rect.size or
+                self.get_state() != self.state)
     
     def draw(self, surface):
-        """Draw panel"""
+        """Draw panel from its cached surface, re-rendering only if needed"""
+        if self.needs_render():
+            if self.cache is None or self.cache.get_size() != self.rect.size:
+                self.cache = pygame.Surface(self.rect.size).convert()
+            self.state = self.get_state()
+            self.render(self.cache)
+            self.dirty = False
+        surface.blit(self.cache, self.rect.topleft)
+    
+    def render(self, surface):
+        """Render panel into its local surface"""
         # Draw background
-        pygame.draw.rect(surface, self.bg_color, self.rect)
+        surface.fill(self.bg_color)
         
         # Draw title bar
-        title_rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.width, 25)
+        title_rect = pygame.Rect(0, 0, self.rect.width, 25)
         pygame.draw.rect(surface, self.title_color, title_rect)
         
         # Draw title text
-        font = pygame.font.Font(None, 20)
-        title_text = font.render(self.title, True, self.text_color)
-        surface.blit(title_text, (self.rect.x + 5, self.rect.y + 5))
+        title_text = font_registry.render(self.title, 20, self.text_color)
+        surface.blit(title_text, (5, 5))
         
         # Draw border
-        pygame.draw.rect(surface, self.border_color, self.rect, 1)
+        pygame.draw.rect(surface, self.border_color, surface.get_rect(), 1)
     
     def contains_point(self, pos):
         """Check if point is inside panel"""
@@ -1,6 +1,7 @@
 """
 Room Editor
 """
+import numpy as np
 import pygame
 from config import *
 from src.editor.texture_loader import texture_loader
@@ -13,37 +14,97 @@ class RoomEditor:
         """Initialize room editor"""
         self.width = width
         self.height = height
-        self.tiles = {}  # Dictionary of (x, y): tile_data
+        
+        # Dense grid of texture ids (0 = empty), indexed [y, x]
+        self.grid = np.zeros((height, width), dtype=np.uint16)
+        self.palette = [None]  # texture id -> texture name
+        self.palette_ids = {}  # texture name -> texture id
+        self.tile_properties = {}  # Sparse (x, y): properties
+        
         self.objects = []
         self.camera_x = 0
         self.camera_y = 0
         self.grid_size = TILE_SIZE
         self.show_grid = True
+        self.grid_overlay = None
+        self.grid_overlay_key = None  # (view size, grid size) overlay was built for
         
         # Current tool
         self.current_tool = "paint"
         self.current_texture = None
+        self.on_edit = None  # Called with an edit dict for each user edit
         
         # Room properties
         self.room_name = "Untitled Room"
         self.background_color = BLACK
     
-    def set_tile(self, grid_x, grid_y, texture_name):
+    @property
+    def tiles(self):
+        """Read-only dictionary of (x, y): tile_data built from the grid"""
+        ys, xs = np.nonzero(self.grid)
+        ids = self.grid[ys, xs].tolist()
+        return {
+            (x, y): {
+                'texture': self.palette[texture_id],
+                'properties': self.tile_properties.get((x, y), {})
+            }
+            for x, y, texture_id in zip(xs.tolist(), ys.tolist(), ids)
+        }
+    
+    def get_texture_id(self, texture_name):
+        """Get palette id for texture, adding it if needed"""
+        texture_id = self.palette_ids.get(texture_name)
+        if texture_id is None:
+            texture_id = len(self.palette)
+            self.palette.append(texture_name)
+            self.palette_ids[texture_name] = texture_id
+        return texture_id
+    
+    def set_tile(self, grid_x, grid_y, texture_name, properties=None):
         """Set tile at grid position"""
         if 0 <= grid_x < self.width and 0 <= grid_y < self.height:
-            self.tiles[(grid_x, grid_y)] = {
-                'texture': texture_name,
-                'properties': {}
-            }
+            self.grid[grid_y, grid_x] = self.get_texture_id(texture_name)
+            if properties:
+                self.tile_properties[(grid_x, grid_y)] = properties
+            else:
+                self.tile_properties.pop((grid_x, grid_y), None)
     
     def remove_tile(self, grid_x, grid_y):
         """Remove tile at grid position"""
-        if (grid_x, grid_y) in self.tiles:
-            del self.tiles[(grid_x, grid_y)]
+        if 0 <= grid_x < self.width and 0 <= grid_y < self.height:
+            self.grid[grid_y, grid_x] = 0
+            self.tile_properties.pop((grid_x, grid_y), None)
     
     def get_tile(self, grid_x, grid_y):
-        """Get tile at grid position"""
-        return self.tiles.get((grid_x, grid_y))
+        """
+        Get tile at grid position
+        
+        The tile dict is built on each call, but its 'properties' is the
+        stored override, so changes made to it are kept. Use set_tile()
+        to change the texture.
+        """
+        if not (0 <= grid_x < self.width and 0 <= grid_y < self.height):
+            return None
+        texture_id = int(self.grid[grid_y, grid_x])
+        if texture_id == 0:
+            return None
+        return {
+            'texture': self.palette[texture_id],
+            'properties': self.tile_properties.setdefault((grid_x, grid_y), {})
+        }
+    
+    def get_visible_range(self, view_width, view_height):
+        """
+        Get range of grid cells visible in the view
+        
+        Returns:
+            (col_start, row_start, col_end, row_end), end exclusive
+        """
+        col_start = max(0, self.camera_x // self.grid_size)
+        row_start = max(0, self.camera_y // self.grid_size)
+        col_end = min(self.width, (self.camera_x + view_width) // self.grid_size + 1)
+        row_end = min(self.height, (self.camera_y + view_height) // self.grid_size + 1)
+        return col_start, row_start, col_end, row_end
     
     def screen_to_grid(self, screen_x, screen_y):
         """Convert screen coordinates to grid coordinates"""
@@ -63,9 +124,28 @@ class RoomEditor:
             if event.button == 1:  # Left click
                 grid_x, grid_y = self.screen_to_grid(*event.pos)
                 if self.current_tool == "paint" and self.current_texture:
-                    self.set_tile(grid_x, grid_y, self.current_texture)
+                    self.apply_edit({'op': 'set_tile', 'x': grid_x, 'y': grid_y,
+                                     'texture': self.current_texture})
                 elif self.current_tool == "erase":
-                    self.remove_tile(grid_x, grid_y)
+                    self.apply_edit({'op': 'remove_tile', 'x': grid_x, 'y': grid_y})
+    
+    def apply_edit(self, edit, notify=True):
+        """
+        Apply an edit dict (as recorded in the edit journal)
+        
+        Args:
+            edit: {'op': 'set_tile' | 'remove_tile', 'x', 'y', ...}
+            notify: Report the edit to on_edit
+        """
+        if edit['op'] == 'set_tile':
+            self.set_tile(edit['x'], edit['y'], edit['texture'], edit.get('properties'))
+        elif edit['op'] == 'remove_tile':
+            self.remove_tile(edit['x'], edit['y'])
+        else:
+            return
+        
+        if notify and self.on_edit:
+            self.on_edit(edit)
     
     def set_current_texture(self, texture_name):
         """Set current texture for painting"""
@@ -84,34 +164,62 @@ class RoomEditor:
         if self.show_grid:
             self._draw_grid(surface, view_rect)
         
-        # Draw tiles
-        for (grid_x, grid_y), tile_data in self.tiles.items():
-            screen_x, screen_y = self.grid_to_screen(grid_x, grid_y)
-            
-            # Only draw if visible
-            if (view_rect.left <= screen_x < view_rect.right and
-                view_rect.top <= screen_y < view_rect.bottom):
-                
-                texture = texture_loader.get_texture(tile_data['texture'])
-                if texture:
-                    scaled = pygame.transform.scale(texture, (self.grid_size, self.grid_size))
-                    surface.blit(scaled, (screen_x, screen_y))
+        # Draw only the visible cells, in a single batch
+        col_start, row_start, col_end, row_end = self.get_visible_range(*surface.get_size())
+        if col_start >= col_end or row_start >= row_end:
+            return
+        
+        visible = self.grid[row_start:row_end, col_start:col_end]
+        rows, cols = np.nonzero(visible)
+        if not len(rows):
+            return
+        
+        # (atlas, rect) per palette entry: most blits share one source surface
+        regions = [
+            texture_loader.get_region(name, self.grid_size) if name else None
+            for name in self.palette
+        ]
+        ids = visible[rows, cols].tolist()
+        xs = ((cols + col_start) * self.grid_size - self.camera_x).tolist()
+        ys = ((rows + row_start) * self.grid_size - self.camera_y).tolist()
+        
+        surface.blits([
+            (regions[texture_id][0], (x, y), regions[texture_id][1])
+            for texture_id, x, y in zip(ids, xs, ys)
+            if regions[texture_id]
+        ], False)
     
-    def _draw_grid(self, surface, view_rect):
-        """Draw grid lines"""
+    def _build_grid_overlay(self, view_size):
+        """Pre-render grid lines one cell larger than the view"""
         grid_color = (60, 60, 60)
+        width = view_size[0] + self.grid_size
+        height = view_size[1] + self.grid_size
+        
+        overlay = pygame.Surface((width, height))
+        overlay.fill(BLACK)
+        overlay.set_colorkey(BLACK, pygame.RLEACCEL)
         
         # Vertical lines
-        start_x = (view_rect.left // self.grid_size) * self.grid_size
-        for x in range(start_x, view_rect.right, self.grid_size):
-            screen_x = x - self.camera_x
-            pygame.draw.line(surface, grid_color, (screen_x, 0), (screen_x, view_rect.height))
+        for x in range(0, width, self.grid_size):
+            pygame.draw.line(overlay, grid_color, (x, 0), (x, height))
         
         # Horizontal lines
-        start_y = (view_rect.top // self.grid_size) * self.grid_size
-        for y in range(start_y, view_rect.bottom, self.grid_size):
-            screen_y = y - self.camera_y
-            pygame.draw.line(surface, grid_color, (0, screen_y), (view_rect.width, screen_y))
+        for y in range(0, height, self.grid_size):
+            pygame.draw.line(overlay, grid_color, (0, y), (width, y))
+        
+        self.grid_overlay = overlay
+        self.grid_overlay_key = (view_size, self.grid_size)
+    
+    def _draw_grid(self, surface, view_rect):
+        """Draw grid lines"""
+        view_size = surface.get_size()
+        if self.grid_overlay_key != (view_size, self.grid_size):
+            self._build_grid_overlay(view_size)
+        
+        # Shift the cached overlay by the sub-cell part of the camera
+        offset_x = -(self.camera_x % self.grid_size)
+        offset_y = -(self.camera_y % self.grid_size)
+        surface.blit(self.grid_overlay, (offset_x, offset_y))
     
     def export_data(self):
         """Export room data"""
@@ -124,17 +232,47 @@ class RoomEditor:
             'background_color': self.background_color
         }
     
+    def export_grid_data(self):
+        """
+        Export room data in the binary level form (grid + palette)
+        
+        Much cheaper than export_data() for large rooms; LevelUtils and
+        level_format accept both forms.
+        """
+        return {
+            'name': self.room_name,
+            'width': self.width,
+            'height': self.height,
+            'grid': self.grid.copy(),
+            'palette': list(self.palette),
+            'properties': [[x, y, props] for (x, y), props in self.tile_properties.items() if props],
+            'objects': self.objects,
+            'background_color': self.background_color
+        }
+    
     def import_data(self, data):
         """Import room data"""
         self.room_name = data.get('name', 'Untitled Room')
-        self.width = data.get('width', 20)
-        self.height = data.get('height', 15)
         self.background_color = data.get('background_color', BLACK)
         
         # Import tiles
-        self.tiles.clear()
-        for x, y, tile_data in data.get('tiles', []):
-            self.tiles[(x, y)] = tile_data
+        self.width = data.get('width', 20)
+        self.height = data.get('height', 15)
+        self.tile_properties = {}
+        if 'grid' in data:
+            # Binary level room: copy the grid, share its palette
+            self.grid = np.array(data['grid'], dtype=np.uint16)
+            self.height, self.width = self.grid.shape
+            self.palette = list(data['palette'])
+            self.palette_ids = {name: i for i, name in enumerate(self.palette) if name}
+            for x, y, properties in data.get('properties', []):
+                self.tile_properties[(x, y)] = properties
+        else:
+            self.grid = np.zeros((self.height, self.width), dtype=np.uint16)
+            self.palette = [None]
+            self.palette_ids = {}
+            for x, y, tile_data in data.get('tiles', []):
+                self.set_tile(x, y, tile_data['texture'], tile_data.get('properties'))
         
         # Import objects
         self.objects = data.get('objects', [])
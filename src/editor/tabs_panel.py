@@ -3,14 +3,16 @@ Tabs Panel
 """
 import pygame
 from config import *
+from src.editor.font_registry import font_registry
+from src.editor.resizable_panel import ResizablePanel
 
 
-class TabsPanel:
+class TabsPanel(ResizablePanel):
     """Panel with tabs for different editing modes"""
     
     def __init__(self, x, y, width, height):
         """Initialize tabs panel"""
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height, "Tabs")
         self.tabs = ["Tiles", "Objects", "Enemies", "Items"]
         self.active_tab = 0
     
@@ -31,21 +33,23 @@ class TabsPanel:
         for i in range(len(self.tabs)):
             if i * tab_width <= relative_x < (i + 1) * tab_width:
                 self.active_tab = i
+                self.mark_dirty()
                 break
     
     def get_active_tab(self):
         """Get currently active tab"""
         return self.tabs[self.active_tab]
     
-    def draw(self, surface):
-        """Draw tabs panel"""
+    def render(self, surface):
+        """Render tabs panel"""
+        surface.fill((30, 30, 30))
         tab_width = self.rect.width // len(self.tabs)
         tab_height = 30
         
         # Draw tabs
         for i, tab in enumerate(self.tabs):
-            x = self.rect.x + i * tab_width
-            y = self.rect.y
+            x = i * tab_width
+            y = 0
             
             # Tab background
             if i == self.active_tab:
@@ -58,7 +62,6 @@ class TabsPanel:
             pygame.draw.rect(surface, (80, 80, 80), tab_rect, 1)
             
             # Tab text
-            font = pygame.font.Font(None, 20)
-            text = font.render(tab, True, WHITE)
+            text = font_registry.render(tab, 20, WHITE)
             text_rect = text.get_rect(center=(x + tab_width // 2, y + tab_height // 2))
             surface.blit(text, text_rect)
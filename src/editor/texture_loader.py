@@ -4,6 +4,8 @@ Texture Loader
 import pygame
 import os
 from config import *
+from src.graphics.atlas import TextureAtlas
+from src.graphics.image_loader import load_images
 
 
 class TextureLoader:
@@ -14,21 +16,35 @@ class TextureLoader:
         self.textures = {}
         self.texture_names = []
         self.assets_path = "assets"
+        self.scaled = {}  # (name, size): scaled surface
+        self.atlas = TextureAtlas()  # (name, size): packed scaled texture
+        self.atlas_sizes = set()  # Sizes requested through get_region()
+        self.version = 0  # Bumped whenever a texture is (re)loaded
+    
+    def add_texture(self, name, surface):
+        """Register (or replace) a texture surface"""
+        self.textures[name] = surface
+        if name not in self.texture_names:
+            self.texture_names.append(name)
+        self.invalidate_scaled(name)
+        
+        # Update atlas in place: reloaded textures keep their slot, new ones are appended
+        for size in self.atlas_sizes:
+            scaled = self.get_scaled(name, size)
+            self.atlas.add((name, size), scaled)
+        self.version += 1
     
     def load_texture(self, name, path):
         """Load texture from file"""
         try:
             full_path = os.path.join(self.assets_path, path)
             if os.path.exists(full_path):
-                self.textures[name] = pygame.image.load(full_path).convert_alpha()
-                if name not in self.texture_names:
-                    self.texture_names.append(name)
+                self.add_texture(name, pygame.image.load(full_path).convert_alpha())
             else:
                 # Create placeholder
-                self.textures[name] = pygame.Surface((TILE_SIZE, TILE_SIZE))
-                self.textures[name].fill(GRAY)
-                if name not in self.texture_names:
-                    self.texture_names.append(name)
+                placeholder = pygame.Surface((TILE_SIZE, TILE_SIZE))
+                placeholder.fill(GRAY)
+                self.add_texture(name, placeholder)
         except Exception as e:
             print(f"Error loading texture {name}: {e}")
     
@@ -36,20 +52,97 @@ class TextureLoader:
         """Get texture by name"""
         return self.textures.get(name)
     
+    def load_textures(self, entries, progress=None):
+        """
+        Load many textures at once on a thread pool
+        
+        Args:
+            entries: Iterable of (name, path) pairs, paths relative to assets_path
+            progress: Optional callback(done, total, name)
+        """
+        entries = [(name, os.path.join(self.assets_path, path)) for name, path in entries]
+        images, errors = load_images(entries, progress=progress)
+        
+        for name, _ in entries:
+            if name in images:
+                self.add_texture(name, images[name])
+            else:
+                print(f"Error loading texture {name}: {errors[name]}")
+                placeholder = pygame.Surface((TILE_SIZE, TILE_SIZE))
+                placeholder.fill(GRAY)
+                self.add_texture(name, placeholder)
+    
+    def get_scaled(self, name, size):
+        """
+        Get texture scaled to a square of the given size
+        
+        Scaled copies are cached until the texture is reloaded.
+        
+        Args:
+            name: Texture name
+            size: Side length in pixels
+        
+        Returns:
+            Scaled surface or None if texture is not loaded
+        """
+        key = (name, size)
+        scaled = self.scaled.get(key)
+        if scaled is None:
+            texture = self.textures.get(name)
+            if texture is None:
+                return None
+            if texture.get_size() == (size, size):
+                scaled = texture
+            else:
+                scaled = pygame.transform.scale(texture, (size, size))
+            self.scaled[key] = scaled
+        return scaled
+    
+    def get_region(self, name, size):
+        """
+        Get texture scaled to size as an (atlas, rect) handle
+        
+        Textures drawn at the same size share a few atlas surfaces, so
+        callers can batch area blits: surface.blits([(atlas, pos, rect), ...]).
+        Textures too large for the atlas return (scaled surface, its rect).
+        
+        Returns:
+            (surface, rect) or None if texture is not loaded
+        """
+        key = (name, size)
+        handle = self.atlas.get(key)
+        if handle is None:
+            scaled = self.get_scaled(name, size)
+            if scaled is None:
+                return None
+            self.atlas_sizes.add(size)
+            handle = self.atlas.add(key, scaled) or (scaled, scaled.get_rect())
+        return handle
+    
+    def invalidate_scaled(self, name=None):
+        """Drop cached scaled copies of one texture (or all if name is None)"""
+        if name is None:
+            self.scaled.clear()
+            return
+        for key in [key for key in self.scaled if key[0] == name]:
+            del self.scaled[key]
+    
     def get_all_textures(self):
         """Get all loaded textures"""
         return self.texture_names
     
-    def scan_assets_directory(self):
+    def scan_assets_directory(self, progress=None):
         """Scan assets directory for textures"""
         if not os.path.exists(self.assets_path):
             os.makedirs(self.assets_path)
             return
         
-        for filename in os.listdir(self.assets_path):
-            if filename.endswith(('.png', '.jpg', '.jpeg')):
-                name = os.path.splitext(filename)[0]
-                self.load_texture(name, filename)
+        entries = [
+            (os.path.splitext(filename)[0], filename)
+            for filename in sorted(os.listdir(self.assets_path))
+            if filename.endswith(('.png', '.jpg', '.jpeg'))
+        ]
+        self.load_textures(entries, progress)
 
 
 # Global texture loader instance
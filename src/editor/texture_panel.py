@@ -3,16 +3,18 @@ Texture Panel
 """
 import pygame
 from config import *
+from src.editor.font_registry import font_registry
+from src.editor.resizable_panel import ResizablePanel
 from src.editor.texture_loader import texture_loader
 from src.graphics.procedural_sprites import ProceduralSpriteGenerator
 
 
-class TexturePanel:
+class TexturePanel(ResizablePanel):
     """Panel for selecting textures"""
     
     def __init__(self, x, y, width, height):
         """Initialize texture panel"""
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height, "Textures")
         self.selected_texture = None
         self.scroll_offset = 0
         self.tile_size = 48
@@ -36,8 +38,7 @@ class TexturePanel:
         }
         
         for name, surface in textures.items():
-            texture_loader.textures[name] = surface
-            texture_loader.texture_names.append(name)
+            texture_loader.add_texture(name, surface)
     
     def handle_event(self, event):
         """Handle panel events"""
@@ -47,11 +48,13 @@ class TexturePanel:
                     self._select_texture(event.pos)
                 elif event.button == 4:  # Scroll up
                     self.scroll_offset = max(0, self.scroll_offset - 1)
+                    self.mark_dirty()
                 elif event.button == 5:  # Scroll down
                     textures = texture_loader.get_all_textures()
                     tiles_per_row = max(1, (self.rect.width - 10) // (self.tile_size + 5))
                     max_scroll = max(0, (len(textures) + tiles_per_row - 1) // tiles_per_row - (self.rect.height - 30) // (self.tile_size + 5))
                     self.scroll_offset = min(max_scroll, self.scroll_offset + 1)
+                    self.mark_dirty()
     
     def _select_texture(self, pos):
         """Select texture at position"""
@@ -71,27 +74,31 @@ class TexturePanel:
         
         if 0 <= index < len(textures):
             self.selected_texture = textures[index]
+            self.mark_dirty()
     
     def get_selected_texture(self):
         """Get currently selected texture"""
         return self.selected_texture
     
-    def draw(self, surface):
-        """Draw texture panel"""
+    def get_state(self):
+        """Re-render when textures are added or reloaded"""
+        return texture_loader.version
+    
+    def render(self, surface):
+        """Render texture panel"""
         # Draw background
-        pygame.draw.rect(surface, (40, 40, 40), self.rect)
+        surface.fill((40, 40, 40))
         
         # Draw title
-        font = pygame.font.Font(None, 24)
-        title = font.render("Textures", True, WHITE)
-        surface.blit(title, (self.rect.x + 5, self.rect.y + 5))
+        title = font_registry.render("Textures", 24, WHITE)
+        surface.blit(title, (5, 5))
         
         # Draw textures
         textures = texture_loader.get_all_textures()
         tiles_per_row = max(1, (self.rect.width - 10) // (self.tile_size + 5))
         
-        x_offset = self.rect.x + 5
-        y_offset = self.rect.y + 30
+        x_offset = 5
+        y_offset = 30
         
         for i, texture_name in enumerate(textures):
             row = i // tiles_per_row - self.scroll_offset
@@ -103,18 +110,16 @@ class TexturePanel:
             x = x_offset + col * (self.tile_size + 5)
             y = y_offset + row * (self.tile_size + 5)
             
-            if y > self.rect.bottom:
+            if y > self.rect.height:
                 break
             
-            texture = texture_loader.get_texture(texture_name)
-            if texture:
-                # Scale texture to tile size
-                scaled = pygame.transform.scale(texture, (self.tile_size, self.tile_size))
-                surface.blit(scaled, (x, y))
+            region = texture_loader.get_region(texture_name, self.tile_size)
+            if region:
+                surface.blit(region[0], (x, y), region[1])
                 
                 # Highlight selected
                 if texture_name == self.selected_texture:
                     pygame.draw.rect(surface, GREEN, (x, y, self.tile_size, self.tile_size), 2)
         
         # Draw border
-        pygame.draw.rect(surface, (80, 80, 80), self.rect, 1)
+        pygame.draw.rect(surface, (80, 80, 80), surface.get_rect(), 1)
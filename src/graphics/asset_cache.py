@@ -0,0 +1,164 @@
+"""
+Asset Cache - memory-budgeted LRU storage for loaded assets
+"""
+from collections import OrderedDict
+import pygame
+from config import *
+
+
+def asset_size(asset):
+    """Estimate memory used by an asset in bytes"""
+    if isinstance(asset, pygame.Surface):
+        return asset.get_pitch() * asset.get_height()
+    if isinstance(asset, (list, tuple)):
+        return sum(asset_size(item) for item in asset)
+    if isinstance(asset, pygame.mixer.Sound):
+        mixer = pygame.mixer.get_init()
+        if mixer:
+            frequency, size, channels = mixer
+            return int(asset.get_length() * frequency * channels * abs(size) // 8)
+    return 0
+
+
+class AssetCache:
+    """
+    LRU cache of assets with a byte budget
+    
+    Assets stored with a reload callback may be evicted once the budget
+    is exceeded and are loaded again on the next get(). Pinned assets and
+    assets without a reload callback are never evicted. Supports the
+    dict operations the asset coordinator used before.
+    """
+    
+    def __init__(self, budget_bytes):
+        """Initialize cache with a budget (0 = unlimited)"""
+        self.budget_bytes = budget_bytes
+        self.assets = OrderedDict()  # name: (asset, size)
+        self.reloaders = {}  # name: callable returning the asset
+        self.pinned = set()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reloads = 0
+    
+    def put(self, name, asset, reload=None, pin=False):
+        """
+        Store asset
+        
+        Args:
+            name: Asset name
+            asset: Loaded asset
+            reload: Callable returning the asset again, makes it evictable
+            pin: Never evict this asset
+        """
+        self._drop(name)
+        size = asset_size(asset)
+        self.assets[name] = (asset, size)
+        self.bytes_used += size
+        if reload is not None:
+            self.reloaders[name] = reload
+        if pin:
+            self.pinned.add(name)
+        self._evict()
+    
+    def get(self, name, default=None):
+        """Get asset, reloading it if it was evicted"""
+        entry = self.assets.get(name)
+        if entry is not None:
+            self.assets.move_to_end(name)
+            self.hits += 1
+            return entry[0]
+        
+        self.misses += 1
+        reload = self.reloaders.get(name)
+        if reload is None:
+            return default
+        
+        asset = reload()
+        self.reloads += 1
+        self.put(name, asset)
+        return asset
+    
+    def pin(self, name):
+        """Keep asset in memory regardless of the budget"""
+        self.pinned.add(name)
+    
+    def unpin(self, name):
+        """Allow asset to be evicted again"""
+        self.pinned.discard(name)
+        self._evict()
+    
+    def set_budget(self, budget_bytes):
+        """Change budget, evicting immediately if needed"""
+        self.budget_bytes = budget_bytes
+        self._evict()
+    
+    def _drop(self, name):
+        """Remove stored asset, keeping its reload callback"""
+        entry = self.assets.pop(name, None)
+        if entry is not None:
+            self.bytes_used -= entry[1]
+    
+    def _evict(self):
+        """Evict least recently used evictable assets until within budget"""
+        if not self.budget_bytes or self.bytes_used <= self.budget_bytes:
+            return
+        for name in list(self.assets):
+            if self.bytes_used <= self.budget_bytes:
+                break
+            if name in self.pinned or name not in self.reloaders:
+                continue
+            self._drop(name)
+            self.evictions += 1
+    
+    def remove(self, name):
+        """Forget asset completely"""
+        self._drop(name)
+        self.reloaders.pop(name, None)
+        self.pinned.discard(name)
+    
+    def clear(self):
+        """Forget all assets"""
+        self.assets.clear()
+        self.reloaders.clear()
+        self.pinned.clear()
+        self.bytes_used = 0
+    
+    def stats(self):
+        """Get cache statistics"""
+        return {
+            'count': len(self.assets),
+            'bytes': self.bytes_used,
+            'budget': self.budget_bytes,
+            'pinned': len(self.pinned),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'reloads': self.reloads,
+        }
+    
+    def __contains__(self, name):
+        """Check if asset is stored or can be reloaded"""
+        return name in self.assets or name in self.reloaders
+    
+    def __len__(self):
+        """Number of assets in memory"""
+        return len(self.assets)
+    
+    def __getitem__(self, name):
+        """Get asset, raising KeyError if unknown"""
+        asset = self.get(name)
+        if asset is None:
+            raise KeyError(name)
+        return asset
+    
+    def __setitem__(self, name, asset):
+        """Store asset without a reload callback"""
+        self.put(name, asset)
+    
+    def __delitem__(self, name):
+        """Forget asset"""
+        if name not in self:
+            raise KeyError(name)
+        self.remove(name)
@@ -4,6 +4,10 @@ Asset Coordinator - Manages game assets
 import pygame
 import os
 from config import *
+from src.graphics.asset_cache import AssetCache
+from src.graphics.image_loader import load_images
+
+MEGABYTE = 1024 * 1024
 
 
 class AssetCoordinator:
@@ -11,9 +15,9 @@ class AssetCoordinator:
     
     def __init__(self):
         """Initialize asset coordinator"""
-        self.textures = {}
-        self.animations = {}
-        self.sounds = {}
+        self.textures = AssetCache(ASSET_TEXTURE_BUDGET_MB * MEGABYTE)
+        self.animations = AssetCache(ASSET_ANIMATION_BUDGET_MB * MEGABYTE)
+        self.sounds = AssetCache(ASSET_SOUND_BUDGET_MB * MEGABYTE)
         self.assets_path = "assets"
     
     def initialize(self):
@@ -25,39 +29,83 @@ class AssetCoordinator:
         if not os.path.exists(self.assets_path):
             os.makedirs(self.assets_path)
     
-    def load_texture(self, name, path):
-        """Load texture from file"""
+    @staticmethod
+    def _placeholder():
+        """Gray tile shown for textures that could not be loaded"""
+        surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        surface.fill(GRAY)
+        return surface
+    
+    def _read_texture(self, name, full_path):
+        """Load texture file, falling back to a placeholder"""
         try:
-            full_path = os.path.join(self.assets_path, path)
             if os.path.exists(full_path):
-                self.textures[name] = pygame.image.load(full_path).convert_alpha()
-            else:
-                # Create placeholder if file doesn't exist
-                self.textures[name] = pygame.Surface((TILE_SIZE, TILE_SIZE))
-                self.textures[name].fill(GRAY)
+                return pygame.image.load(full_path).convert_alpha()
         except Exception as e:
             print(f"Error loading texture {name}: {e}")
-            self.textures[name] = pygame.Surface((TILE_SIZE, TILE_SIZE))
-            self.textures[name].fill(GRAY)
+        return self._placeholder()
+    
+    def load_texture(self, name, path, pin=False):
+        """
+        Load texture from file
+        
+        Args:
+            name: Texture name
+            path: Path relative to assets_path
+            pin: Keep in memory regardless of the texture budget
+        """
+        full_path = os.path.join(self.assets_path, path)
+        self.textures.put(
+            name, self._read_texture(name, full_path),
+            reload=lambda: self._read_texture(name, full_path), pin=pin
+        )
+    
+    def load_textures(self, entries, progress=None):
+        """
+        Load many textures at once, decoding on a thread pool
+        
+        Args:
+            entries: Iterable of (name, path) pairs, paths relative to assets_path
+            progress: Optional callback(done, total, name)
+        """
+        entries = [(name, os.path.join(self.assets_path, path)) for name, path in entries]
+        images, errors = load_images(
+            [(name, path) for name, path in entries if os.path.exists(path)], progress=progress
+        )
+        
+        for name, full_path in entries:
+            if name in images:
+                texture = images[name]
+            else:
+                if name in errors:
+                    print(f"Error loading texture {name}: {errors[name]}")
+                texture = self._placeholder()
+            self.textures.put(
+                name, texture,
+                reload=lambda name=name, full_path=full_path: self._read_texture(name, full_path)
+            )
     
     def get_texture(self, name):
         """Get cached texture"""
         return self.textures.get(name)
     
-    def load_animation(self, name, frames):
-        """Load animation from frames"""
-        self.animations[name] = frames
+    def load_animation(self, name, frames, pin=False):
+        """Load animation from frames (kept until removed: frames cannot be reloaded)"""
+        self.animations.put(name, frames, pin=pin)
     
     def get_animation(self, name):
         """Get cached animation frames"""
         return self.animations.get(name, [])
     
-    def load_sound(self, name, path):
+    def load_sound(self, name, path, pin=False):
         """Load sound from file"""
         try:
             full_path = os.path.join(self.assets_path, path)
             if os.path.exists(full_path):
-                self.sounds[name] = pygame.mixer.Sound(full_path)
+                self.sounds.put(
+                    name, pygame.mixer.Sound(full_path),
+                    reload=lambda: pygame.mixer.Sound(full_path), pin=pin
+                )
         except Exception as e:
             print(f"Error loading sound {name}: {e}")
     
@@ -65,6 +113,25 @@ class AssetCoordinator:
         """Get cached sound"""
         return self.sounds.get(name)
     
+    def pin(self, name):
+        """Keep a texture, animation or sound in memory regardless of budgets"""
+        for cache in (self.textures, self.animations, self.sounds):
+            if name in cache:
+                cache.pin(name)
+    
+    def unpin(self, name):
+        """Let an asset be evicted again"""
+        for cache in (self.textures, self.animations, self.sounds):
+            cache.unpin(name)
+    
+    def get_stats(self):
+        """Get hit/miss and memory statistics of each cache"""
+        return {
+            'textures': self.textures.stats(),
+            'animations': self.animations.stats(),
+            'sounds': self.sounds.stats(),
+        }
+    
     def clear_cache(self):
         """Clear all cached assets"""
         self.textures.clear()
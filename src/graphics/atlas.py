@@ -0,0 +1,131 @@
+"""
+Texture Atlas - packs small textures into a few large surfaces
+"""
+import pygame
+from config import *
+
+
+class AtlasPage:
+    """One atlas surface filled with shelf (row-by-row) packing"""
+    
+    def __init__(self, size, padding):
+        """Initialize empty page"""
+        self.size = size
+        self.padding = padding
+        self.surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        self.shelves = []  # [y, height, next_x]
+        self.next_y = 0
+    
+    def allocate(self, width, height):
+        """
+        Reserve a rectangle on the page
+        
+        Returns:
+            pygame.Rect or None if the page is full
+        """
+        width += self.padding
+        height += self.padding
+        
+        # Shortest shelf that fits keeps wasted height low
+        best = None
+        for shelf in self.shelves:
+            y, shelf_height, next_x = shelf
+            if height <= shelf_height and next_x + width <= self.size:
+                if best is None or shelf_height < best[1]:
+                    best = shelf
+        
+        if best is None:
+            if self.next_y + height > self.size or width > self.size:
+                return None
+            best = [self.next_y, height, 0]
+            self.shelves.append(best)
+            self.next_y += height
+        
+        rect = pygame.Rect(best[2], best[0], width - self.padding, height - self.padding)
+        best[2] += width
+        return rect
+
+
+class TextureAtlas:
+    """
+    Packs textures into shared pages and hands out (atlas, rect) handles
+    
+    Drawing many textures from the same page lets callers batch area
+    blits with Surface.blits(). Textures are added incrementally; replacing
+    one reuses its slot when the size is unchanged (otherwise the old slot
+    stays unused until clear()).
+    """
+    
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, max_texture_size=ATLAS_MAX_TEXTURE_SIZE, padding=1):
+        """
+        Args:
+            page_size: Side length of each atlas surface
+            max_texture_size: Larger textures are not packed
+            padding: Empty pixels between textures (avoids bleeding when scaled)
+        """
+        self.page_size = page_size
+        self.max_texture_size = max_texture_size
+        self.padding = padding
+        self.pages = []
+        self.regions = {}  # key: (page surface, rect)
+    
+    def accepts(self, surface):
+        """Check if a texture is small enough to pack"""
+        width, height = surface.get_size()
+        return width <= self.max_texture_size and height <= self.max_texture_size
+    
+    def add(self, key, surface):
+        """
+        Pack texture and return its handle
+        
+        Args:
+            key: Any hashable key (e.g. texture name or (name, size))
+            surface: Texture surface
+        
+        Returns:
+            (atlas surface, rect) or None if the texture is too large
+        """
+        if not self.accepts(surface):
+            return None
+        
+        handle = self.regions.get(key)
+        if handle is None or handle[1].size != surface.get_size():
+            handle = self._allocate(*surface.get_size())
+            self.regions[key] = handle
+        
+        # Colorkeyed textures: turn the key into transparent pixels first,
+        # since the additive copy below ignores colorkeys
+        if surface.get_colorkey() is not None:
+            keyed = surface
+            surface = pygame.Surface(keyed.get_size(), pygame.SRCALPHA)
+            surface.fill((0, 0, 0, 0))
+            surface.blit(keyed, (0, 0))
+        
+        # Copy pixels exactly, including alpha
+        page, rect = handle
+        page.fill((0, 0, 0, 0), rect)
+        page.blit(surface, rect, special_flags=pygame.BLEND_RGBA_ADD)
+        return handle
+    
+    def _allocate(self, width, height):
+        """Find space on an existing page or start a new one"""
+        for page in self.pages:
+            rect = page.allocate(width, height)
+            if rect is not None:
+                return page.surface, rect
+        
+        page = AtlasPage(self.page_size, self.padding)
+        self.pages.append(page)
+        return page.surface, page.allocate(width, height)
+    
+    def get(self, key):
+        """Get handle of a packed texture or None"""
+        return self.regions.get(key)
+    
+    def clear(self):
+        """Drop all pages"""
+        self.pages.clear()
+        self.regions.clear()
@@ -0,0 +1,75 @@
+"""
+Dirty Rectangle Renderer - redraws and presents only changed screen areas
+"""
+import pygame
+from config import *
+
+
+class DirtyRectRenderer:
+    """
+    Keeps a cached background (clear color + level) and presents only the
+    rects touched by moving sprites, falling back to a full flip whenever
+    the background itself changes (camera scroll, level edit, resize).
+    """
+    
+    def __init__(self, screen, rect_limit=DIRTY_RECT_LIMIT):
+        """
+        Initialize dirty rect renderer
+        
+        Args:
+            screen: Display surface
+            rect_limit: Above this many dirty rects a full flip is cheaper
+        """
+        self.screen = screen
+        self.rect_limit = rect_limit
+        self.background = None
+        self.background_key = None
+        self.previous_rects = []
+        self.full_redraw = True
+    
+    def invalidate(self):
+        """Force a full redraw on the next frame"""
+        self.background_key = None
+    
+    def begin_frame(self, level, camera_x, camera_y, clear_color=BLACK):
+        """
+        Prepare the screen for drawing sprites
+        
+        Either restores the background under last frame's sprites or, if
+        the background changed, redraws it entirely.
+        
+        Returns:
+            True if this frame is a full redraw
+        """
+        key = (camera_x, camera_y, level.version, self.screen.get_size())
+        self.full_redraw = key != self.background_key
+        
+        if self.full_redraw:
+            if self.background is None or self.background.get_size() != self.screen.get_size():
+                self.background = pygame.Surface(self.screen.get_size()).convert()
+            self.background.fill(clear_color)
+            level.draw(self.background, camera_x, camera_y)
+            self.background_key = key
+            self.screen.blit(self.background, (0, 0))
+        else:
+            self.screen.blits(
+                [(self.background, rect, rect) for rect in self.previous_rects],
+                doreturn=False
+            )
+        return self.full_redraw
+    
+    def present(self, rects):
+        """
+        Show the frame
+        
+        Args:
+            rects: Screen rects drawn this frame (sprites, projectiles, HUD)
+        """
+        rects = [rect for rect in rects if rect.width and rect.height]
+        dirty = self.previous_rects + rects
+        self.previous_rects = rects
+        
+        if self.full_redraw or len(dirty) > self.rect_limit:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
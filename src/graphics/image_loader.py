@@ -0,0 +1,87 @@
+"""
+Image Loader - decodes image files on a thread pool
+"""
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pygame
+from config import *
+
+
+def _decode(path):
+    """Read and decode one image file"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return pygame.image.load(io.BytesIO(data), path)
+
+
+def _decode_batch(batch):
+    """Decode a batch of (name, path) pairs (runs on a worker thread)"""
+    results = []
+    for name, path in batch:
+        try:
+            results.append((name, _decode(path), None))
+        except Exception as e:
+            results.append((name, None, e))
+    return results
+
+
+def load_images(entries, workers=ASSET_LOAD_WORKERS, progress=None):
+    """
+    Load many images in parallel
+    
+    File reading and decoding run on a thread pool; convert_alpha() needs
+    the display and runs afterwards on the calling thread in one batch.
+    
+    Args:
+        entries: Iterable of (name, path) pairs
+        workers: Thread count, 0 = one per CPU core
+        progress: Optional callback(done, total, name) called on the calling thread
+    
+    Returns:
+        Tuple (images, errors): {name: Surface} and {name: exception}
+    """
+    entries = list(entries)
+    total = len(entries)
+    images = {}
+    errors = {}
+    if not entries:
+        return images, errors
+    
+    start = time.perf_counter()
+    workers = min(workers or os.cpu_count() or 1, total)
+    done = 0
+    
+    # A few batches per thread keep pool overhead low and the load balanced
+    batch_size = max(1, -(-total // (workers * 4)))
+    batches = [entries[i:i + batch_size] for i in range(0, total, batch_size)]
+    
+    if workers == 1:
+        results = map(_decode_batch, batches)
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+        futures = [pool.submit(_decode_batch, batch) for batch in batches]
+        results = (future.result() for future in as_completed(futures))
+    
+    for batch in results:
+        for name, image, error in batch:
+            if error is None:
+                images[name] = image
+            else:
+                errors[name] = error
+            done += 1
+            if progress:
+                progress(done, total, name)
+    
+    if workers > 1:
+        pool.shutdown()
+    
+    # Pixel format conversion needs the display, do it in one pass here
+    if pygame.display.get_surface() is not None:
+        for name, image in images.items():
+            images[name] = image.convert_alpha()
+    
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Loaded {len(images)}/{total} images in {elapsed:.1f} ms ({workers} threads)")
+    return images, errors
@@ -0,0 +1,57 @@
+"""
+Sprite Cache - shared sprites for entities that look the same
+"""
+import pygame
+from config import *
+from src.graphics.atlas import TextureAtlas
+from src.graphics.procedural_sprites import ProceduralSpriteGenerator
+
+
+class SpriteCache:
+    """Keeps one surface per sprite kind so identical entities share it"""
+    
+    def __init__(self):
+        """Initialize sprite cache"""
+        self.tile_sprites = {}
+        self.projectile_sprites = {}
+        self.tile_atlas = TextureAtlas()
+    
+    def get_tile_sprite(self, tile_type):
+        """Get shared sprite for a tile type"""
+        sprite = self.tile_sprites.get(tile_type)
+        if sprite is None:
+            color = TILE_COLORS.get(tile_type, GRAY)
+            sprite = ProceduralSpriteGenerator.generate_tile_sprite(TILE_SIZE, TILE_SIZE, color)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self.tile_sprites[tile_type] = sprite
+        return sprite
+    
+    def get_tile_region(self, tile_type):
+        """Get tile sprite as an (atlas, rect) handle for batched area blits"""
+        handle = self.tile_atlas.get(tile_type)
+        if handle is None:
+            sprite = self.get_tile_sprite(tile_type)
+            handle = self.tile_atlas.add(tile_type, sprite) or (sprite, sprite.get_rect())
+        return handle
+    
+    def get_projectile_sprite(self, color=WHITE):
+        """Get shared 8x8 projectile sprite for a color"""
+        color = tuple(color)
+        sprite = self.projectile_sprites.get(color)
+        if sprite is None:
+            sprite = ProceduralSpriteGenerator.generate_projectile_sprite(8, 8, color)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self.projectile_sprites[color] = sprite
+        return sprite
+    
+    def clear(self):
+        """Clear all cached sprites"""
+        self.tile_sprites.clear()
+        self.projectile_sprites.clear()
+        self.tile_atlas.clear()
+
+
+# Global sprite cache instance
+sprite_cache = SpriteCache()
@@ -0,0 +1,117 @@
+"""
+HUD - cached text rendering and heads-up display widgets
+"""
+from collections import OrderedDict
+import pygame
+from config import *
+
+
+class FontCache:
+    """Process-wide cache of loaded fonts"""
+    
+    def __init__(self):
+        """Initialize font cache"""
+        self.fonts = {}
+    
+    def get(self, size, name=None):
+        """
+        Get font, loading it on first use
+        
+        Args:
+            size: Font size in points
+            name: Font file path, or None for the pygame default font
+        """
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self.fonts[key] = font
+        return font
+    
+    def clear(self):
+        """Drop all loaded fonts"""
+        self.fonts.clear()
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color)"""
+    
+    def __init__(self, capacity=TEXT_CACHE_SIZE):
+        """Initialize text cache"""
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, text, size, color=WHITE, name=None):
+        """Get rendered text surface, rasterizing it only on a cache miss"""
+        key = (name, size, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font_cache.get(size, name).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        """Drop all rendered surfaces"""
+        self.surfaces.clear()
+
+
+# Global caches
+font_cache = FontCache()
+text_cache = TextCache()
+
+
+class HudText:
+    """Text widget bound to a value; re-renders only when the value changes"""
+    
+    def __init__(self, pos, getter, template="{}", size=36, color=WHITE):
+        """
+        Initialize HUD text widget
+        
+        Args:
+            pos: Top-left screen position
+            getter: Callable returning the bound value
+            template: Format string applied to the value
+            size: Font size
+            color: Text color
+        """
+        self.pos = pos
+        self.getter = getter
+        self.template = template
+        self.size = size
+        self.color = color
+        self.value = None
+        self.surface = None
+    
+    def draw(self, surface):
+        """Draw widget, returns the screen rect it covers"""
+        value = self.getter()
+        if self.surface is None or value != self.value:
+            self.value = value
+            self.surface = text_cache.render(self.template.format(value), self.size, self.color)
+        return surface.blit(self.surface, self.pos)
+
+
+class Hud:
+    """Collection of HUD widgets"""
+    
+    def __init__(self):
+        """Initialize HUD"""
+        self.widgets = []
+    
+    def add(self, widget):
+        """Add widget"""
+        self.widgets.append(widget)
+        return widget
+    
+    def draw(self, surface):
+        """Draw all widgets, returns the list of rects they cover"""
+        return [widget.draw(surface) for widget in self.widgets]
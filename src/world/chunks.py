@@ -0,0 +1,85 @@
+"""
+Chunk Renderer - caches static tiles in pre-rendered chunk surfaces
+"""
+import pygame
+from config import *
+from src.graphics.sprite_cache import sprite_cache
+
+
+class ChunkRenderer:
+    """Bakes tiles into CHUNK_SIZE x CHUNK_SIZE surfaces and blits only visible chunks"""
+    
+    def __init__(self, level, chunk_size=CHUNK_SIZE):
+        """
+        Initialize chunk renderer
+        
+        Args:
+            level: LevelBuilder providing get_tiles_in_rect()
+            chunk_size: Chunk side length in tiles
+        """
+        self.level = level
+        self.chunk_size = chunk_size
+        self.chunk_pixels = chunk_size * TILE_SIZE
+        self.chunks = {}  # Dictionary of (chunk_x, chunk_y): Surface or None (empty)
+    
+    def cell_to_chunk(self, col, row):
+        """Get chunk coordinates containing a tile cell"""
+        return col // self.chunk_size, row // self.chunk_size
+    
+    def invalidate_cell(self, col, row):
+        """Mark the chunk containing a tile cell for re-baking"""
+        self.chunks.pop(self.cell_to_chunk(col, row), None)
+    
+    def invalidate_all(self):
+        """Drop all baked chunks"""
+        self.chunks.clear()
+    
+    def _bake_chunk(self, chunk_x, chunk_y):
+        """Render all tiles of a chunk into a single surface"""
+        origin_x = chunk_x * self.chunk_pixels
+        origin_y = chunk_y * self.chunk_pixels
+        area = pygame.Rect(origin_x, origin_y, self.chunk_pixels, self.chunk_pixels)
+        
+        tiles = self.level.get_tiles_in_rect(area)
+        if not tiles:
+            return None
+        
+        # Tile sprites live in a shared atlas, so the chunk is one batched blit
+        surface = pygame.Surface((self.chunk_pixels, self.chunk_pixels), pygame.SRCALPHA)
+        blits = []
+        for tile in tiles:
+            atlas, rect = sprite_cache.get_tile_region(tile.tile_type)
+            blits.append((atlas, (tile.x - origin_x, tile.y - origin_y), rect))
+        surface.blits(blits, doreturn=False)
+        
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+    
+    def get_chunk(self, chunk_x, chunk_y):
+        """Get baked chunk surface, baking it on first use"""
+        key = (chunk_x, chunk_y)
+        if key not in self.chunks:
+            self.chunks[key] = self._bake_chunk(chunk_x, chunk_y)
+        return self.chunks[key]
+    
+    def draw(self, surface, camera_x=0, camera_y=0):
+        """Blit chunks overlapping the camera view"""
+        camera_x = int(camera_x)
+        camera_y = int(camera_y)
+        view_width, view_height = surface.get_size()
+        
+        first_x = camera_x // self.chunk_pixels
+        first_y = camera_y // self.chunk_pixels
+        last_x = (camera_x + view_width - 1) // self.chunk_pixels
+        last_y = (camera_y + view_height - 1) // self.chunk_pixels
+        
+        blits = []
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                chunk = self.get_chunk(chunk_x, chunk_y)
+                if chunk is not None:
+                    blits.append((chunk, (chunk_x * self.chunk_pixels - camera_x,
+                                          chunk_y * self.chunk_pixels - camera_y)))
+        
+        surface.blits(blits, doreturn=False)
@@ -0,0 +1,185 @@
+"""
+Tile Collision - swept AABB resolution against the tile grid
+"""
+import math
+import numpy as np
+from config import *
+
+
+class TileCollider:
+    """Moves axis-aligned boxes through a LevelBuilder grid one axis at a time"""
+    
+    def __init__(self, level):
+        """
+        Initialize tile collider
+        
+        Args:
+            level: LevelBuilder providing is_solid(col, row)
+        """
+        self.level = level
+    
+    @staticmethod
+    def _first_cell(position):
+        """Grid index of the cell containing a box's leading coordinate"""
+        return math.floor(position / TILE_SIZE)
+    
+    @staticmethod
+    def _last_cell(position):
+        """Grid index of the cell containing a box's trailing edge (exclusive)"""
+        return math.ceil(position / TILE_SIZE) - 1
+    
+    def _column_blocked(self, col, top, bottom):
+        """Check if any cell of a column span is solid"""
+        for row in range(top, bottom + 1):
+            if self.level.is_solid(col, row):
+                return True
+        return False
+    
+    def _row_blocked(self, row, left, right):
+        """Check if any cell of a row span is solid"""
+        for col in range(left, right + 1):
+            if self.level.is_solid(col, row):
+                return True
+        return False
+    
+    def move(self, x, y, width, height, vx, vy):
+        """
+        Move a box by (vx, vy), stopping at solid tiles
+        
+        Only the cells swept by the leading edge are checked, so the cost
+        depends on the distance moved and not on the number of tiles.
+        
+        Returns:
+            Tuple (x, y, vx, vy, on_ground, hit_wall) with the resolved
+            position, velocities zeroed on blocked axes and contact flags
+        """
+        hit_wall = False
+        on_ground = False
+        
+        # Horizontal axis
+        if vx:
+            top = self._first_cell(y)
+            bottom = self._last_cell(y + height)
+            if vx > 0:
+                start = self._last_cell(x + width) + 1
+                end = self._last_cell(x + width + vx)
+                for col in range(start, end + 1):
+                    if self._column_blocked(col, top, bottom):
+                        x = col * TILE_SIZE - width
+                        vx = 0
+                        hit_wall = True
+                        break
+            else:
+                start = self._first_cell(x) - 1
+                end = self._first_cell(x + vx)
+                for col in range(start, end - 1, -1):
+                    if self._column_blocked(col, top, bottom):
+                        x = (col + 1) * TILE_SIZE
+                        vx = 0
+                        hit_wall = True
+                        break
+            if not hit_wall:
+                x += vx
+        
+        # Vertical axis (uses the resolved horizontal position)
+        if vy:
+            left = self._first_cell(x)
+            right = self._last_cell(x + width)
+            blocked = False
+            if vy > 0:
+                start = self._last_cell(y + height) + 1
+                end = self._last_cell(y + height + vy)
+                for row in range(start, end + 1):
+                    if self._row_blocked(row, left, right):
+                        y = row * TILE_SIZE - height
+                        vy = 0
+                        blocked = True
+                        on_ground = True
+                        break
+            else:
+                start = self._first_cell(y) - 1
+                end = self._first_cell(y + vy)
+                for row in range(start, end - 1, -1):
+                    if self._row_blocked(row, left, right):
+                        y = (row + 1) * TILE_SIZE
+                        vy = 0
+                        blocked = True
+                        break
+            if not blocked:
+                y += vy
+        
+        return x, y, vx, vy, on_ground, hit_wall
+    
+    def solid_cells(self, cols, rows):
+        """Vectorized solidity test for arrays of cell coordinates"""
+        origin_col, origin_row, grid = self.level.get_solid_grid()
+        cols = cols - origin_col
+        rows = rows - origin_row
+        inside = (cols >= 0) & (rows >= 0) & (cols < grid.shape[1]) & (rows < grid.shape[0])
+        solid = np.zeros(cols.shape, dtype=np.bool_)
+        solid[inside] = grid[rows[inside], cols[inside]]
+        return solid
+    
+    def _sweep_axis(self, pos, size, vel, cross_pos, cross_size, horizontal):
+        """
+        Resolve movement along one axis for arrays of boxes
+        
+        Returns:
+            Tuple (new_pos, blocked_mask)
+        """
+        # Leading-edge cell before and after the move
+        forward = vel > 0
+        lead_before = np.where(forward, np.ceil((pos + size) / TILE_SIZE) - 1,
+                               np.floor(pos / TILE_SIZE)).astype(np.int64)
+        lead_after = np.where(forward, np.ceil((pos + size + vel) / TILE_SIZE) - 1,
+                              np.floor((pos + vel) / TILE_SIZE)).astype(np.int64)
+        entering = lead_after != lead_before
+        
+        # Cells spanned on the other axis
+        first = np.floor(cross_pos / TILE_SIZE).astype(np.int64)
+        last = (np.ceil((cross_pos + cross_size) / TILE_SIZE) - 1).astype(np.int64)
+        
+        blocked = np.zeros(pos.shape, dtype=np.bool_)
+        if entering.any():
+            for offset in range(int((last - first).max()) + 1):
+                lane = first + offset
+                check = entering & (lane <= last)
+                if check.any():
+                    if horizontal:
+                        blocked |= check & self.solid_cells(lead_after, lane)
+                    else:
+                        blocked |= check & self.solid_cells(lane, lead_after)
+        
+        new_pos = pos + vel
+        new_pos = np.where(blocked & forward, lead_after * TILE_SIZE - size, new_pos)
+        new_pos = np.where(blocked & ~forward, (lead_after + 1) * TILE_SIZE, new_pos)
+        return new_pos, blocked
+    
+    def move_many(self, x, y, width, height, vx, vy):
+        """
+        Vectorized move() for arrays of boxes
+        
+        Velocities must not exceed TILE_SIZE per axis (true for gravity
+        capped at MAX_FALL_SPEED), so each axis enters at most one new
+        row/column of cells per call.
+        
+        Returns:
+            Tuple of arrays (x, y, vx, vy, on_ground, hit_wall)
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        vx = np.clip(np.asarray(vx, dtype=np.float64), -TILE_SIZE, TILE_SIZE)
+        vy = np.clip(np.asarray(vy, dtype=np.float64), -TILE_SIZE, TILE_SIZE)
+        width = np.broadcast_to(np.asarray(width, dtype=np.float64), x.shape)
+        height = np.broadcast_to(np.asarray(height, dtype=np.float64), y.shape)
+        
+        # Horizontal axis: leading column against the rows the box spans
+        x, hit_wall = self._sweep_axis(x, width, vx, y, height, True)
+        vx = np.where(hit_wall, 0.0, vx)
+        
+        # Vertical axis: leading row against the columns the box spans
+        y, blocked = self._sweep_axis(y, height, vy, x, width, False)
+        on_ground = blocked & (vy > 0)
+        vy = np.where(blocked, 0.0, vy)
+        
+        return x, y, vx, vy, on_ground, hit_wall
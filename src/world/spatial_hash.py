@@ -0,0 +1,128 @@
+"""
+Spatial Hash - uniform grid broadphase for moving entities
+"""
+import numpy as np
+from config import *
+
+
+class SpatialHash:
+    """
+    Uniform grid mapping cells to entity indices
+    
+    Entities are given as arrays of boxes and bucketed by every cell they
+    overlap. Buckets are stored as one array sorted by cell key, so a full
+    rebuild every tick and batched queries are vectorized and roughly
+    linear in the number of entities.
+    """
+    
+    # Cell coordinates are offset so they pack into one non-negative int64 key
+    KEY_OFFSET = 1 << 20
+    
+    def __init__(self, cell_size=TILE_SIZE):
+        """Initialize spatial hash"""
+        self.cell_size = cell_size
+        self.keys = np.zeros(0, dtype=np.int64)  # Sorted cell keys
+        self.items = np.zeros(0, dtype=np.int64)  # Entity index per key
+        self.boxes = ([], [], [], [])  # Boxes passed to the last rebuild()
+    
+    def _cell_range(self, pos, size):
+        """First and last cell covered by [pos, pos + size)"""
+        first = np.floor(pos / self.cell_size).astype(np.int64)
+        last = (np.ceil((pos + size) / self.cell_size) - 1).astype(np.int64)
+        return first, np.maximum(first, last)
+    
+    def _pack(self, cols, rows):
+        """Pack cell coordinates into keys"""
+        return ((cols + self.KEY_OFFSET) << 21) | (rows + self.KEY_OFFSET)
+    
+    def _expand(self, x, y, width, height):
+        """
+        List every (cell key, box index) pair for arrays of boxes
+        
+        Returns:
+            Tuple (keys, indices)
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        width = np.broadcast_to(np.asarray(width, dtype=np.float64), x.shape)
+        height = np.broadcast_to(np.asarray(height, dtype=np.float64), y.shape)
+        if not len(x):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        
+        first_col, last_col = self._cell_range(x, width)
+        first_row, last_row = self._cell_range(y, height)
+        span_cols = int((last_col - first_col).max()) + 1
+        span_rows = int((last_row - first_row).max()) + 1
+        
+        keys = []
+        indices = []
+        index = np.arange(len(x), dtype=np.int64)
+        for dc in range(span_cols):
+            for dr in range(span_rows):
+                cols = first_col + dc
+                rows = first_row + dr
+                valid = (cols <= last_col) & (rows <= last_row)
+                keys.append(self._pack(cols[valid], rows[valid]))
+                indices.append(index[valid])
+        return np.concatenate(keys), np.concatenate(indices)
+    
+    def rebuild(self, x, y, width, height):
+        """Replace contents with boxes given as arrays; entity i gets index i"""
+        self.boxes = (x, y, width, height)
+        keys, items = self._expand(x, y, width, height)
+        order = np.argsort(keys, kind='stable')
+        self.keys = keys[order]
+        self.items = items[order]
+    
+    def __len__(self):
+        """Number of (cell, entity) entries"""
+        return len(self.keys)
+    
+    def query_many(self, x, y, width, height):
+        """
+        Find entities sharing a cell with each query box
+        
+        Returns:
+            Tuple of arrays (query_indices, entity_indices), one entry per
+            candidate pair, without duplicates. Candidates still need an
+            exact overlap test.
+        """
+        if not len(self.keys):
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        
+        query_keys, queries = self._expand(x, y, width, height)
+        start = np.searchsorted(self.keys, query_keys, side='left')
+        end = np.searchsorted(self.keys, query_keys, side='right')
+        counts = end - start
+        
+        total = int(counts.sum())
+        if not total:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        
+        # Expand [start, end) ranges into flat positions
+        query_indices = np.repeat(queries, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        entity_indices = self.items[np.repeat(start, counts) + offsets]
+        
+        # A pair can meet in several cells; dedupe on a packed 1-D key
+        stride = int(self.items.max()) + 1
+        pairs = np.unique(query_indices * stride + entity_indices)
+        return pairs // stride, pairs % stride
+    
+    def query(self, rect):
+        """Find candidate entity indices overlapping a rect (x, y, width, height)"""
+        _, entities = self.query_many([rect[0]], [rect[1]], [rect[2]], [rect[3]])
+        return entities
+    
+    def query_pairs(self):
+        """
+        Find pairs of stored entities sharing a cell
+        
+        Returns:
+            Tuple of arrays (a, b) with a < b, without duplicates
+        """
+        a, b = self.query_many(*self.boxes)
+        keep = a < b
+        return a[keep], b[keep]
@@ -1,28 +1,39 @@
 """
 Tilemap and Level Builder
 """
+import os
+import time
+import numpy as np
 import pygame
 from config import *
-from src.graphics.procedural_sprites import ProceduralSpriteGenerator
+from src.editor.level_utils import LevelUtils
+from src.graphics.sprite_cache import sprite_cache
+from src.world.chunks import ChunkRenderer
+from src.world.collision import TileCollider
 
 
 class Tile:
     """Individual tile class"""
     
+    __slots__ = ('x', 'y', 'tile_type', 'image')
+    
     def __init__(self, x, y, tile_type="ground"):
         """Initialize tile"""
         self.x = x
         self.y = y
         self.tile_type = tile_type
         
-        # Graphics
-        sprite_gen = ProceduralSpriteGenerator()
-        self.image = sprite_gen.generate_tile_sprite(TILE_SIZE, TILE_SIZE)
-        self.rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
+        # Graphics (shared between all tiles of the same type)
+        self.image = sprite_cache.get_tile_sprite(tile_type)
+    
+    @property
+    def rect(self):
+        """Tile bounds in world coordinates"""
+        return pygame.Rect(self.x, self.y, TILE_SIZE, TILE_SIZE)
     
     def draw(self, surface, camera_x=0, camera_y=0):
         """Draw tile"""
-        surface.blit(self.image, (self.rect.x - camera_x, self.rect.y - camera_y))
+        surface.blit(self.image, (self.x - camera_x, self.y - camera_y))
 
 
 class LevelBuilder:
@@ -30,14 +41,27 @@ class LevelBuilder:
     
     def __init__(self):
         """Initialize level builder"""
-        self.tiles = []
+        self.tiles = {}  # Dictionary of (col, row): Tile
         self.width = 0
         self.height = 0
+        self.renderer = ChunkRenderer(self)
+        self.collider = TileCollider(self)
+        self.solid_grid = None  # Cached (origin_col, origin_row, bool array), see get_solid_grid()
+        self.version = 0  # Incremented on every change, for render caches
+    
+    @staticmethod
+    def world_to_cell(x, y):
+        """Convert world coordinates to tile grid coordinates"""
+        return int(x // TILE_SIZE), int(y // TILE_SIZE)
     
     def add_tile(self, x, y, tile_type="ground"):
-        """Add tile to level"""
+        """Add tile to level (replaces any tile in the same cell)"""
         tile = Tile(x, y, tile_type)
-        self.tiles.append(tile)
+        cell = self.world_to_cell(x, y)
+        self.tiles[cell] = tile
+        self.renderer.invalidate_cell(*cell)
+        self.solid_grid = None
+        self.version += 1
         
         # Update level dimensions
         self.width = max(self.width, x + TILE_SIZE)
@@ -45,43 +69,206 @@ class LevelBuilder:
         
         return tile
     
+    def add_tiles(self, cols, rows, tile_types):
+        """
+        Bulk-insert tiles at grid cells
+        
+        Caches are invalidated once for the whole batch instead of per tile.
+        
+        Args:
+            cols: Sequence of tile columns
+            rows: Sequence of tile rows
+            tile_types: Sequence of tile types, one per cell
+        """
+        cols = np.asarray(cols, dtype=np.int64)
+        rows = np.asarray(rows, dtype=np.int64)
+        if not len(cols):
+            return
+        
+        self.tiles.update(
+            ((col, row), Tile(col * TILE_SIZE, row * TILE_SIZE, tile_type))
+            for col, row, tile_type in zip(cols.tolist(), rows.tolist(), tile_types)
+        )
+        self.renderer.invalidate_all()
+        self.solid_grid = None
+        self.version += 1
+        
+        # Update level dimensions
+        self.width = max(self.width, int(cols.max() + 1) * TILE_SIZE)
+        self.height = max(self.height, int(rows.max() + 1) * TILE_SIZE)
+    
+    def load_room(self, room):
+        """
+        Add tiles of an editor room (JSON or binary level form)
+        
+        The room is placed at its 'origin' cell (default 0, 0); tile
+        textures become tile types.
+        """
+        origin_col, origin_row = room.get('origin', (0, 0))
+        if 'grid' in room:
+            # Binary level form: palette lookup over the whole grid at once
+            grid = np.asarray(room['grid'])
+            rows, cols = np.nonzero(grid)
+            palette = room['palette']
+            tile_types = [palette[i] for i in grid[rows, cols].tolist()]
+        else:
+            tiles = room.get('tiles', [])
+            cols = np.array([tile[0] for tile in tiles], dtype=np.int64)
+            rows = np.array([tile[1] for tile in tiles], dtype=np.int64)
+            tile_types = [tile[2]['texture'] for tile in tiles]
+        self.add_tiles(cols + origin_col, rows + origin_row, tile_types)
+    
     def remove_tile(self, x, y):
         """Remove tile at position"""
-        self.tiles = [t for t in self.tiles if not (t.x == x and t.y == y)]
+        cell = self.world_to_cell(x, y)
+        tile = self.tiles.pop(cell, None)
+        if tile is not None:
+            self.renderer.invalidate_cell(*cell)
+            self.solid_grid = None
+            self.version += 1
+        return tile
     
     def get_tile_at(self, x, y):
         """Get tile at position"""
-        for tile in self.tiles:
-            if tile.x == x and tile.y == y:
-                return tile
-        return None
+        return self.tiles.get(self.world_to_cell(x, y))
+    
+    def get_tile_at_cell(self, col, row):
+        """Get tile at grid cell"""
+        return self.tiles.get((col, row))
+    
+    def is_solid(self, col, row):
+        """Check if grid cell blocks movement"""
+        return (col, row) in self.tiles
+    
+    def get_solid_grid(self):
+        """
+        Get dense solidity grid for vectorized collision
+        
+        Returns:
+            Tuple (origin_col, origin_row, grid) where grid[row, col] is True
+            for solid cells, offset by the origin cell. Rebuilt only after
+            tiles change.
+        """
+        if self.solid_grid is None:
+            if self.tiles:
+                cells = np.array(list(self.tiles.keys()), dtype=np.int64)
+                origin_col, origin_row = cells.min(axis=0)
+                size_col, size_row = cells.max(axis=0) - (origin_col, origin_row) + 1
+                grid = np.zeros((size_row, size_col), dtype=np.bool_)
+                grid[cells[:, 1] - origin_row, cells[:, 0] - origin_col] = True
+            else:
+                origin_col = origin_row = 0
+                grid = np.zeros((0, 0), dtype=np.bool_)
+            self.solid_grid = (int(origin_col), int(origin_row), grid)
+        return self.solid_grid
     
     def get_tiles(self):
         """Get all tiles"""
-        return self.tiles
+        return list(self.tiles.values())
     
-    def load_from_file(self, filename):
-        """Load level from file"""
-        # TODO: Implement level loading
-        pass
+    def get_tiles_in_rect(self, rect):
+        """Get tiles overlapping a world-space rectangle"""
+        rect = pygame.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        
+        left, top = self.world_to_cell(rect.left, rect.top)
+        right, bottom = self.world_to_cell(rect.right - 1, rect.bottom - 1)
+        
+        # Scan whichever is smaller: the cells in the rect or the stored tiles
+        cell_count = (right - left + 1) * (bottom - top + 1)
+        if cell_count > len(self.tiles):
+            return [
+                tile for (col, row), tile in self.tiles.items()
+                if left <= col <= right and top <= row <= bottom
+            ]
+        
+        tiles = []
+        for row in range(top, bottom + 1):
+            for col in range(left, right + 1):
+                tile = self.tiles.get((col, row))
+                if tile is not None:
+                    tiles.append(tile)
+        return tiles
+    
+    def load_from_file(self, filename, room_index=0):
+        """
+        Load a room of an editor level (JSON or binary) into the world
+        
+        Args:
+            filename: Level file saved by the level editor
+            room_index: Room to load
+        
+        Returns:
+            True if the room was loaded
+        """
+        if not os.path.exists(filename):
+            print(f"Error loading level: {filename} not found")
+            return False
+        
+        # Only one room is needed, so binary levels are opened without prefetch
+        start = time.perf_counter()
+        level_data = LevelUtils.open_level(filename, prefetch_from=None)
+        if not level_data or not LevelUtils.validate_level(level_data):
+            print(f"Error loading level: {filename} is not a valid level")
+            return False
+        
+        rooms = level_data['rooms']
+        if not 0 <= room_index < len(rooms):
+            print(f"Error loading level: {filename} has no room {room_index}")
+            LevelUtils.close_level(level_data)
+            return False
+        
+        self.clear()
+        self.load_room(rooms[room_index])
+        LevelUtils.close_level(level_data)
+        
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"Loaded {len(self.tiles)} tiles from {filename} in {elapsed:.1f} ms")
+        return True
     
     def save_to_file(self, filename):
-        """Save level to file"""
-        # TODO: Implement level saving
-        pass
+        """
+        Save tiles as a single-room editor level (.lvl for binary)
+        
+        Returns:
+            True if the level was saved
+        """
+        origin_col, origin_row, solid = self.get_solid_grid()
+        palette = [None]
+        palette_ids = {}
+        grid = np.zeros(solid.shape, dtype=np.uint16)
+        for (col, row), tile in self.tiles.items():
+            texture_id = palette_ids.get(tile.tile_type)
+            if texture_id is None:
+                texture_id = palette_ids[tile.tile_type] = len(palette)
+                palette.append(tile.tile_type)
+            grid[row - origin_row, col - origin_col] = texture_id
+        
+        level_data = LevelUtils.create_new_level()
+        level_data['rooms'] = [{
+            'name': 'Room',
+            'width': grid.shape[1],
+            'height': grid.shape[0],
+            'origin': [origin_col, origin_row],
+            'grid': grid,
+            'palette': palette,
+            'properties': [],
+            'objects': [],
+            'background_color': BLACK
+        }]
+        return LevelUtils.save_level(level_data, filename)
     
     def draw(self, surface, camera_x=0, camera_y=0):
         """Draw all tiles"""
-        for tile in self.tiles:
-            # Only draw tiles visible on screen
-            if (tile.rect.x - camera_x < SCREEN_WIDTH and
-                tile.rect.x - camera_x + TILE_SIZE > 0 and
-                tile.rect.y - camera_y < SCREEN_HEIGHT and
-                tile.rect.y - camera_y + TILE_SIZE > 0):
-                tile.draw(surface, camera_x, camera_y)
+        # Tiles are static, so they are drawn from pre-rendered chunks
+        self.renderer.draw(surface, camera_x, camera_y)
     
     def clear(self):
         """Clear all tiles"""
         self.tiles.clear()
+        self.renderer.invalidate_all()
+        self.solid_grid = None
+        self.version += 1
         self.width = 0
         self.height = 0